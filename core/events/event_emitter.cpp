@@ -165,7 +165,8 @@ bool EventFilter::matches(const Event &event) const {
 
             if (!provider_id.empty()) {
                 if constexpr (std::is_same_v<T, StateUpdateEvent> || std::is_same_v<T, QualityChangeEvent> ||
-                              std::is_same_v<T, DeviceAvailabilityEvent>) {
+                              std::is_same_v<T, DeviceAvailabilityEvent> ||
+                              std::is_same_v<T, ProviderHealthChangeEvent>) {
                     if (e.provider_id != provider_id) {
                         return false;
                     }
@@ -223,13 +223,17 @@ struct BTErrorEvent {
 /**
  * @brief Provider health change event
  *
- * Emitted when a provider's availability state changes.
+ * Emitted when a provider's availability or supervision state (attempt count,
+ * crash detection, circuit breaker) changes.
  */
 struct ProviderHealthChangeEvent {
     uint64_t event_id;
     std::string provider_id;
     std::string state;  // "AVAILABLE" or "UNAVAILABLE"
     int64_t timestamp_ms;
+    int attempt_count = 0;
+    bool crash_detected = false;
+    bool circuit_open = false;
 };
 
 /**
@@ -301,6 +301,9 @@ std::string HttpServer::format_sse_event(const events::Event &event) {
 
                 data["provider_id"] = e.provider_id;
                 data["state"] = e.state;
+                data["attempt_count"] = e.attempt_count;
+                data["crash_detected"] = e.crash_detected;
+                data["circuit_open"] = e.circuit_open;
                 data["timestamp_ms"] = e.timestamp_ms;
             }
 
@@ -1,5 +1,9 @@
 #include <chrono>
 #include <fstream>
+#include <functional>
+#include <map>
+#include <sstream>
+#include <utility>
 
 #include "anolis_build_config.hpp"
 #if ANOLIS_ENABLE_AUTOMATION
@@ -35,6 +39,30 @@ std::string derive_lifecycle_state(bool is_available,
 
     return "DOWN";
 }
+
+// If-None-Match uses weak comparison (RFC 9110 13.1.2): any listed tag whose opaque part equals
+// the current tag's, ignoring W/ prefixes, or "*" matches.
+bool if_none_match_hits(const std::string &header, const std::string &etag) {
+    const auto opaque = [](std::string tag) { return tag.rfind("W/", 0) == 0 ? tag.substr(2) : tag; };
+    const std::string current = opaque(etag);
+    std::size_t pos = 0;
+    while (pos <= header.size()) {
+        std::size_t comma = header.find(',', pos);
+        if (comma == std::string::npos) {
+            comma = header.size();
+        }
+        const std::size_t first = header.find_first_not_of(" \t", pos);
+        if (first != std::string::npos && first < comma) {
+            const std::size_t last = header.find_last_not_of(" \t", comma - 1);
+            const std::string tag = header.substr(first, last - first + 1);
+            if (tag == "*" || opaque(tag) == current) {
+                return true;
+            }
+        }
+        pos = comma + 1;
+    }
+    return false;
+}
 }  // namespace
 
 //=============================================================================
@@ -440,7 +468,7 @@ void HttpServer::handle_get_automation_status(const httplib::Request &, httplib:
 //=============================================================================
 // GET /v0/providers/health
 //=============================================================================
-void HttpServer::handle_get_providers_health(const httplib::Request &, httplib::Response &res) {
+void HttpServer::handle_get_providers_health(const httplib::Request &req, httplib::Response &res) {
     using namespace std::chrono;
     using SupervisionSnapshot = provider::ProviderSupervisor::ProviderSupervisionSnapshot;
 
@@ -450,55 +478,103 @@ void HttpServer::handle_get_providers_health(const httplib::Request &, httplib::
         snapshots = supervisor_->get_all_snapshots();
     }
 
-    nlohmann::json providers_json = nlohmann::json::array();
-
-    // Iterate through all providers
+    struct DeviceHealth {
+        std::string device_id;
+        std::string health_status;
+        uint64_t last_poll_ms = 0;
+        uint64_t staleness_ms = 0;
+    };
+
+    struct ProviderInputs {
+        bool is_available = false;
+        std::vector<DeviceHealth> devices;
+    };
+
+    // First pass: gather inputs and the supervision signature used as a weak validator.
+    // Timing fields (uptime, staleness, last_seen_ago_ms, next_restart_in_ms values) change on
+    // every request and are excluded; the per-device health category is included, so a device
+    // crossing an OK/WARNING/STALE boundary changes the tag. W/ marks equal tags as semantically
+    // equivalent for supervision and health state, not byte-identical. Ordered map keeps the
+    // signature stable.
+    const auto now = system_clock::now();
+    std::map<std::string, ProviderInputs> inputs;
     for (const auto &[provider_id, provider] : provider_registry_.get_all_providers()) {
-        // Get provider availability
-        bool is_available = provider->is_available();
-        std::string state = is_available ? "AVAILABLE" : "UNAVAILABLE";
-
-        // Get devices for this provider
-        auto devices = registry_.get_devices_for_provider(provider_id);
-
-        nlohmann::json devices_json = nlohmann::json::array();
+        auto &in = inputs[provider_id];
+        in.is_available = provider->is_available();
 
         // Check health of each device
-        for (const auto &device : devices) {
-            std::string device_handle = provider_id + "/" + device.device_id;
-            auto device_state = state_cache_.get_device_state(device_handle);
-
-            std::string health_status = "UNKNOWN";
-            uint64_t last_poll_ms = 0;
-            uint64_t staleness_ms = 0;
+        for (const auto &device : registry_.get_devices_for_provider(provider_id)) {
+            DeviceHealth health{device.device_id, "UNKNOWN"};
+            auto device_state = state_cache_.get_device_state(provider_id + "/" + device.device_id);
 
             if (device_state) {
-                last_poll_ms = duration_cast<milliseconds>(device_state->last_poll_time.time_since_epoch()).count();
+                health.last_poll_ms =
+                    duration_cast<milliseconds>(device_state->last_poll_time.time_since_epoch()).count();
 
-                auto now = system_clock::now();
                 auto age_ms = duration_cast<milliseconds>(now - device_state->last_poll_time).count();
 
-                staleness_ms = age_ms;
+                health.staleness_ms = age_ms;
 
                 // Determine health based on staleness
                 // OK: < 2 seconds, WARNING: 2-5 seconds, STALE: > 5 seconds
-                if (!is_available) {
-                    health_status = "UNAVAILABLE";
+                if (!in.is_available) {
+                    health.health_status = "UNAVAILABLE";
                 } else if (age_ms < 2000) {
-                    health_status = "OK";
+                    health.health_status = "OK";
                 } else if (age_ms < 5000) {
-                    health_status = "WARNING";
+                    health.health_status = "WARNING";
                 } else {
-                    health_status = "STALE";
+                    health.health_status = "STALE";
                 }
-            } else {
-                health_status = "UNKNOWN";
             }
 
+            in.devices.push_back(std::move(health));
+        }
+    }
+
+    std::string signature;
+    for (const auto &[provider_id, in] : inputs) {
+        signature += provider_id + (in.is_available ? ":A:" : ":U:") + std::to_string(in.devices.size());
+        auto snap_it = snapshots.find(provider_id);
+        if (snap_it != snapshots.end()) {
+            const auto &snap = snap_it->second;
+            signature += ":" + std::to_string(snap.attempt_count) + (snap.crash_detected ? ":C" : ":-") +
+                         (snap.circuit_open ? ":O" : ":-") + (snap.next_restart_in_ms.has_value() ? ":R" : ":-") +
+                         (snap.last_seen_ago_ms.has_value() ? ":S" : ":-");
+        }
+        for (const auto &device : in.devices) {
+            signature += "|" + device.device_id + "=" + device.health_status;
+        }
+        signature += ";";
+    }
+    std::ostringstream etag_stream;
+    etag_stream << "W/\"" << std::hex << std::hash<std::string>{}(signature) << "\"";
+    const std::string etag = etag_stream.str();
+
+    res.set_header("ETag", etag);
+    res.set_header("Cache-Control", "no-store");  // Conditional requests are opt-in for pollers only
+    if (if_none_match_hits(req.get_header_value("If-None-Match"), etag)) {
+        res.status = 304;
+        return;
+    }
+
+    nlohmann::json providers_json = nlohmann::json::array();
+
+    // Iterate through all providers
+    for (const auto &[provider_id, in] : inputs) {
+        // Get provider availability
+        bool is_available = in.is_available;
+        std::string state = is_available ? "AVAILABLE" : "UNAVAILABLE";
+
+        // Devices for this provider (health derived in the first pass)
+        const auto &devices = in.devices;
+
+        nlohmann::json devices_json = nlohmann::json::array();
+        for (const auto &device : devices) {
             devices_json.push_back({{"device_id", device.device_id},
-                                    {"health", health_status},
-                                    {"last_poll_ms", last_poll_ms},
-                                    {"staleness_ms", staleness_ms}});
+                                    {"health", device.health_status},
+                                    {"last_poll_ms", device.last_poll_ms},
+                                    {"staleness_ms", device.staleness_ms}});
         }
 
         // Build provider-level timing fields and supervision block.
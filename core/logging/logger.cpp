@@ -10,12 +10,67 @@ namespace anolis {
 namespace logging {
 
 Level Logger::threshold_ = Level::LVL_INFO;
+Format Logger::format_ = Format::TEXT;
 std::mutex Logger::mutex_;
 
+namespace {
+
+const char *level_name(Level level) {
+    switch (level) {
+        case Level::LVL_DEBUG:
+            return "DEBUG";
+        case Level::LVL_INFO:
+            return "INFO";
+        case Level::LVL_WARN:
+            return "WARN";
+        case Level::LVL_ERROR:
+            return "ERROR";
+        default:
+            return "NONE";
+    }
+}
+
+// Minimal JSON string escaping (RFC 8259) so the logger stays free of JSON library dependencies.
+void write_json_string(std::ostream &out, const std::string &value) {
+    out << '"';
+    for (char c : value) {
+        switch (c) {
+            case '"':
+                out << "\\\"";
+                break;
+            case '\\':
+                out << "\\\\";
+                break;
+            case '\n':
+                out << "\\n";
+                break;
+            case '\r':
+                out << "\\r";
+                break;
+            case '\t':
+                out << "\\t";
+                break;
+            default:
+                if (static_cast<unsigned char>(c) < 0x20) {
+                    out << "\\u" << std::hex << std::setw(4) << std::setfill('0')
+                        << static_cast<int>(static_cast<unsigned char>(c)) << std::dec;
+                } else {
+                    out << c;
+                }
+                break;
+        }
+    }
+    out << '"';
+}
+
+}  // namespace
+
 void Logger::init(Level threshold) { threshold_ = threshold; }
 
 void Logger::set_level(Level level) { threshold_ = level; }
 
+void Logger::set_format(Format format) { format_ = format; }
+
 void Logger::log(Level level, const char *file, int line, const std::string &message) {
     static_cast<void>(file);
     static_cast<void>(line);
@@ -37,6 +92,20 @@ void Logger::log(Level level, const char *file, int line, const std::string &mes
 
     std::lock_guard<std::mutex> lock(mutex_);
 
+    if (format_ == Format::JSONL) {
+        // One self-contained JSON object per line: {"ts":"...","level":"INFO","msg":"..."}
+        std::cerr << "{\"ts\":\"" << std::put_time(&tm_buf, "%Y-%m-%d %H:%M:%S");
+        std::cerr << "." << std::setfill('0') << std::setw(3) << ms.count() << "\",\"level\":\"" << level_name(level)
+                  << "\",\"msg\":";
+        write_json_string(std::cerr, message);
+        std::cerr << "}\n";
+
+        if (level >= Level::LVL_ERROR) {
+            std::cerr << std::flush;
+        }
+        return;
+    }
+
     // Timestamp
     std::cerr << "[" << std::put_time(&tm_buf, "%Y-%m-%d %H:%M:%S");
     std::cerr << "." << std::setfill('0') << std::setw(3) << ms.count() << "]";
@@ -88,5 +157,16 @@ Level string_to_level(const std::string &level_str) {
     return Level::LVL_INFO;  // Default
 }
 
+Format string_to_format(const std::string &format_str) {
+    std::string s = format_str;
+    std::transform(s.begin(), s.end(), s.begin(), [](unsigned char c) { return static_cast<char>(std::tolower(c)); });
+
+    if (s == "jsonl") {
+        return Format::JSONL;
+    }
+
+    return Format::TEXT;  // Default
+}
+
 }  // namespace logging
 }  // namespace anolis
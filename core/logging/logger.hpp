@@ -9,20 +9,28 @@ namespace logging {
 
 enum class Level { LVL_DEBUG, LVL_INFO, LVL_WARN, LVL_ERROR, LVL_NONE };
 
+// Output line format: human-readable text, or one JSON object per line
+enum class Format { TEXT, JSONL };
+
 class Logger {
 public:
     static void init(Level threshold);
     static void log(Level level, const char *file, int line, const std::string &message);
     static void set_level(Level level);
+    static void set_format(Format format);
 
 private:
     static Level threshold_;
+    static Format format_;
     static std::mutex mutex_;
 };
 
 // Helper to convert Level to string for config parsing
 Level string_to_level(const std::string &level_str);
 
+// Helper to convert format name ("text"/"jsonl") to Format for config parsing
+Format string_to_format(const std::string &format_str);
+
 }  // namespace logging
 }  // namespace anolis
 
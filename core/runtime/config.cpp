@@ -267,6 +267,10 @@ bool validate_config(const RuntimeConfig &config, std::string &error) {
         error = "Invalid log level: " + config.logging.level;
         return false;
     }
+    if (config.logging.format != "text" && config.logging.format != "jsonl") {
+        error = "Invalid log format: " + config.logging.format + " (expected text or jsonl)";
+        return false;
+    }
 
     // Validate Automation settings
     if (config.automation.enabled) {
@@ -652,6 +656,9 @@ bool load_config(const std::string &config_path, RuntimeConfig &config, std::str
             if (yaml["logging"]["level"]) {
                 config.logging.level = yaml["logging"]["level"].as<std::string>();
             }
+            if (yaml["logging"]["format"]) {
+                config.logging.format = yaml["logging"]["format"].as<std::string>();
+            }
         }
 
         // Load automation config
@@ -923,7 +930,7 @@ bool load_config(const std::string &config_path, RuntimeConfig &config, std::str
         }
         LOG_INFO(telemetry_msg.str());
 
-        LOG_INFO("[Config] Log level: " << config.logging.level);
+        LOG_INFO("[Config] Log level: " << config.logging.level << ", format: " << config.logging.format);
 
         std::stringstream automation_msg;
         automation_msg << "[Config] Automation: " << (config.automation.enabled ? "enabled" : "disabled");
@@ -28,7 +28,8 @@ struct PollingConfig {
 
 /** @brief Runtime logging settings. */
 struct LoggingConfig {
-    std::string level = "info";  // debug, info, warn, error
+    std::string level = "info";   // debug, info, warn, error
+    std::string format = "text";  // text, jsonl (one JSON object per line)
 };
 
 /**
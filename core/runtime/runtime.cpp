@@ -543,6 +543,8 @@ void Runtime::run() {
                 }
             }
         }
+
+        emit_provider_health_changes();
     }
 
     LOG_INFO("[Runtime] Shutting down");
@@ -578,6 +580,43 @@ void Runtime::shutdown() {
     provider_registry_.clear();
 }
 
+void Runtime::emit_provider_health_changes() {
+    if (!event_emitter_) {
+        return;
+    }
+
+    for (const auto &provider_config : config_.providers) {
+        const std::string &id = provider_config.id;
+        auto provider = provider_registry_.get_provider(id);
+        if (!provider) {
+            continue;
+        }
+
+        events::ProviderHealthChangeEvent event;
+        event.provider_id = id;
+        event.state = provider->is_available() ? "AVAILABLE" : "UNAVAILABLE";
+        if (auto snapshot = supervisor_->get_snapshot(id)) {
+            event.attempt_count = snapshot->attempt_count;
+            event.crash_detected = snapshot->crash_detected;
+            event.circuit_open = snapshot->circuit_open;
+        }
+
+        std::string signature = event.state + "/" + std::to_string(event.attempt_count) + "/" +
+                                (event.crash_detected ? "1" : "0") + "/" + (event.circuit_open ? "1" : "0");
+        auto &last = last_health_signature_[id];
+        if (last == signature) {
+            continue;
+        }
+        last = std::move(signature);
+
+        event.event_id = event_emitter_->next_event_id();
+        event.timestamp_ms =
+            std::chrono::duration_cast<std::chrono::milliseconds>(std::chrono::system_clock::now().time_since_epoch())
+                .count();
+        event_emitter_->emit(event);
+    }
+}
+
 bool Runtime::restart_provider(const std::string &provider_id, const provider::ProviderConfig &provider_config) {
     // Start timeout clock (timeout starts after backoff completes, when restart attempt begins)
     auto restart_start_time = std::chrono::steady_clock::now();
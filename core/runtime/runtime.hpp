@@ -109,6 +109,15 @@ private:
      */
     bool restart_provider(const std::string &provider_id, const provider::ProviderConfig &provider_config);
 
+    /**
+     * @brief Emit ProviderHealthChangeEvent for providers whose health changed.
+     *
+     * Compares availability plus supervision state (attempt count, crash
+     * detection, circuit breaker) against the last emitted value so SSE
+     * clients can wait on transitions instead of polling /v0/providers/health.
+     */
+    void emit_provider_health_changes();
+
     RuntimeConfig config_;
 
     provider::ProviderRegistry provider_registry_;
@@ -124,6 +133,7 @@ private:
     std::unique_ptr<automation::BTRuntime> bt_runtime_;
 #endif
     std::unique_ptr<provider::ProviderSupervisor> supervisor_;
+    std::unordered_map<std::string, std::string> last_health_signature_;  // Main-loop thread only
 
     std::atomic<bool> running_{false};
 };
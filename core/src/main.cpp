@@ -14,6 +14,7 @@ int main(int argc, char **argv) {
     // Parse CLI arguments
     std::string config_path = "anolis-runtime.yaml";  // Default
     bool check_config_only = false;
+    std::string log_format_override;  // Overrides logging.format when set
 
     for (int i = 1; i < argc; ++i) {
         std::string arg = argv[i];
@@ -25,11 +26,18 @@ int main(int argc, char **argv) {
         } else if (arg == "--check-config" && i + 1 < argc) {
             config_path = argv[++i];
             check_config_only = true;
+        } else if (arg.substr(0, 13) == "--log-format=") {
+            log_format_override = arg.substr(13);
+            if (log_format_override != "text" && log_format_override != "jsonl") {
+                std::cerr << "Invalid --log-format: " << log_format_override << " (expected text or jsonl)\n";
+                return 1;
+            }
         } else if (arg == "--help" || arg == "-h") {
             std::cerr << "Usage: anolis-runtime [OPTIONS]\n\n";
             std::cerr << "Options:\n";
             std::cerr << "  --config=PATH         Path to config file (default: anolis-runtime.yaml)\n";
             std::cerr << "  --check-config PATH   Validate config file and exit (0=ok, 1=error)\n";
+            std::cerr << "  --log-format=FORMAT   Log line format: text or jsonl (overrides logging.format)\n";
             std::cerr << "  --help, -h            Show this help\n";
             return 0;
         } else {
@@ -39,6 +47,10 @@ int main(int argc, char **argv) {
         }
     }
 
+    if (!log_format_override.empty()) {
+        anolis::logging::Logger::set_format(anolis::logging::string_to_format(log_format_override));
+    }
+
     // Check if config exists
     if (!std::filesystem::exists(config_path)) {
         // Using cerr here as logger might not be initialized/configured
@@ -71,8 +83,13 @@ int main(int argc, char **argv) {
         return 0;
     }
 
-    // Initialize logger level
+    if (!log_format_override.empty()) {
+        config.logging.format = log_format_override;
+    }
+
+    // Initialize logger level and line format
     anolis::logging::Logger::set_level(anolis::logging::string_to_level(config.logging.level));
+    anolis::logging::Logger::set_format(anolis::logging::string_to_format(config.logging.format));
 
     // Create and initialize runtime
     anolis::runtime::Runtime runtime(config);
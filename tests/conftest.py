@@ -17,7 +17,7 @@ def _repo_root() -> Path:
 
 def _first_existing(paths: Iterable[Path]) -> Path | None:
     for path in paths:
-        if path.exists() and path.is_file():
+        if path.is_file():
             return path.resolve()
     return None
 
@@ -117,7 +117,7 @@ def _provider_candidates(root: Path) -> list[Path]:
 def _resolve_runtime(requested: str | None) -> Path:
     if requested:
         path = Path(requested)
-        if path.exists() and path.is_file():
+        if path.is_file():
             return path.resolve()
         raise RuntimeError(f"--runtime path does not exist: {path}")
 
@@ -131,7 +131,7 @@ def _resolve_runtime(requested: str | None) -> Path:
 def _resolve_provider(requested: str | None) -> Path:
     if requested:
         path = Path(requested)
-        if path.exists() and path.is_file():
+        if path.is_file():
             return path.resolve()
         raise RuntimeError(f"--provider path does not exist: {path}")
 
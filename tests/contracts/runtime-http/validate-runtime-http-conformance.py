@@ -172,7 +172,7 @@ def _pick_free_port() -> int:
 
 def _first_existing(paths: Iterable[Path]) -> Path | None:
     for path in paths:
-        if path.exists() and path.is_file():
+        if path.is_file():
             return path.resolve()
     return None
 
@@ -13,23 +13,79 @@ Tests:
 6. Failed restart attempts remain supervised and recoverable
 7. Restart timeout policy is behaviorally enforced
 8. Runtime startup timeout is behaviorally enforced
+9. Health waits release their event subscription when they return
 
 """
 
+import io
 import sys
 import tempfile
 import textwrap
+import threading
 import time
+from collections import deque
+from contextlib import closing
 from pathlib import Path
-from typing import Callable, List, NoReturn, Optional, Tuple
+from typing import Callable, Deque, List, NamedTuple, NoReturn, Optional, Tuple
+
+import requests
 
 from tests.support.api_helpers import (
+    HEALTH_WATCHER_THREAD_PREFIX,
     assert_http_available,
     assert_provider_available,
-    get_provider_health_entry,
+    stream_provider_health,
 )
 from tests.support.runtime_fixture import RuntimeFixture
 
+# Startup readiness is paid by every case (each needs a fresh runtime and provider-sim), so poll it
+# finely over the tester's keep-alive session instead of the helpers' coarse 0.2s/0.5s defaults.
+READY_POLL_INTERVAL_S = 0.05
+
+
+class HealthSnapshot(NamedTuple):
+    """Compact provider health sample used by wait predicates and failure timelines."""
+
+    t: float
+    present: bool
+    state: Optional[str]
+    attempt_count: Optional[int]
+    crash_detected: Optional[bool]
+    circuit_open: Optional[bool]
+    max_attempts: Optional[int]
+    next_restart_in_ms: Optional[int]
+    uptime_seconds: Optional[float]
+    device_count: Optional[int]
+
+
+_MISSING_SNAPSHOT = HealthSnapshot(0.0, False, "MISSING", None, None, None, None, None, None, None)
+
+
+# Wait predicates shared by several checks; defined once so polling loops do not rebuild them.
+def _crash_handled(s: HealthSnapshot) -> bool:
+    return s.present and ((s.attempt_count or 0) >= 1 or s.crash_detected is True)
+
+
+def _went_down(s: HealthSnapshot) -> bool:
+    return (not s.present) or s.state == "UNAVAILABLE"
+
+
+def _circuit_opened(s: HealthSnapshot) -> bool:
+    return s.present and s.circuit_open is True
+
+
+def _recovered_clean(s: HealthSnapshot) -> bool:
+    return (
+        s.present
+        and s.state == "AVAILABLE"
+        and s.crash_detected is False
+        and (s.next_restart_in_ms == 0 or s.next_restart_in_ms is None)
+    )
+
+
+def _recovered_with_reset_attempts(s: HealthSnapshot) -> bool:
+    return s.present and s.state == "AVAILABLE" and (s.device_count or 0) > 0 and (s.attempt_count or 0) == 0
+
 
 class SupervisionTester:
     """Test harness for provider supervision integration tests."""
@@ -41,6 +97,11 @@ class SupervisionTester:
         self.port = port
         self.fixture: Optional[RuntimeFixture] = None
         self.base_url = f"http://127.0.0.1:{port}"
+        # One keep-alive connection for all health polls instead of a TCP connect per request
+        self.http = requests.Session()
+        # Forward-slash paths are embedded in every generated config and wrapper invocation
+        self._provider_cmd = str(provider_sim_path).replace("\\", "/")
+        self._fixture_config = str(Path(__file__).parent / "fixtures" / "provider-sim-default.yaml").replace("\\", "/")
 
     @property
     def capture(self):
@@ -60,9 +121,6 @@ class SupervisionTester:
         if backoff_ms is None:
             backoff_ms = [100, 1000, 5000]
 
-        provider_cmd = str(self.provider_sim_path).replace("\\", "/")
-        fixture_config = Path(__file__).parent / "fixtures" / "provider-sim-default.yaml"
-
         config = {
             "http": {
                 "enabled": True,
@@ -72,8 +130,8 @@ class SupervisionTester:
             "providers": [
                 {
                     "id": "provider-sim",
-                    "command": provider_cmd,
-                    "args": ["--config", str(fixture_config).replace("\\", "/"), "--crash-after", str(crash_after)],
+                    "command": self._provider_cmd,
+                    "args": ["--config", self._fixture_config, "--crash-after", str(crash_after)],
                     "timeout_ms": 1500,
                     # Keep supervision tests responsive: lower provider RPC timeout reduces
                     # crash-detection latency and avoids flaky timing races in CI.
@@ -87,22 +145,23 @@ class SupervisionTester:
                 }
             ],
             "polling": {"interval_ms": 200},
-            "logging": {"level": "info"},
+            "logging": {"level": "info", "format": "jsonl"},
         }
 
         return config
 
-    def _default_provider_fixture_config(self) -> str:
-        fixture_config = Path(__file__).parent / "fixtures" / "provider-sim-default.yaml"
-        return str(fixture_config).replace("\\", "/")
-
     def _write_wrapper_script(self, temp_dir: Path, filename: str, script_body: str) -> Path:
         script_path = temp_dir / filename
         script_path.write_text(textwrap.dedent(script_body), encoding="utf-8")
         return script_path
 
-    def start_runtime(self, config_dict: dict) -> None:
-        """Start runtime with given config."""
+    def start_runtime(self, config_dict: dict, wait_for_http: bool = True) -> None:
+        """
+        Start runtime with given config.
+
+        Callers that immediately wait for provider availability pass wait_for_http=False:
+        that poll hits the same status endpoint, so a separate HTTP probe only adds a round-trip.
+        """
         self.fixture = RuntimeFixture(
             self.runtime_path,
             self.provider_sim_path,
@@ -115,16 +174,19 @@ class SupervisionTester:
         self.base_url = self.fixture.base_url
 
         # Wait for HTTP server to respond — API-based readiness check.
-        if not assert_http_available(self.base_url, timeout=10.0):
+        if wait_for_http and not assert_http_available(
+            self.base_url, timeout=10.0, session=self.http, interval=READY_POLL_INTERVAL_S
+        ):
             capture = self.fixture.get_output_capture()
             output_tail = capture.get_recent_output(120) if capture else "(no output capture)"
             raise AssertionError(f"Runtime HTTP server did not become available\nOutput tail:\n{output_tail}")
 
     def stop_runtime(self):
-        """Stop runtime gracefully."""
+        """Stop runtime with a bounded teardown (graceful shutdown is not under test here)."""
+        self.http.close()  # Drop pooled connections to this runtime; the session reconnects on next use
         if self.fixture:
             try:
-                self.fixture.cleanup()
+                self.fixture.fast_cleanup()
             except Exception:
                 pass  # Cleanup error, ignore
 
@@ -132,88 +194,94 @@ class SupervisionTester:
         if self.fixture is None:
             return True
 
-        deadline = time.time() + timeout
-        while time.time() < deadline:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
             if not self.fixture.is_running():
                 return True
             time.sleep(0.05)
         return False
 
-    def _sample_provider_health(self) -> dict:
-        """Capture a compact provider health snapshot for failure timelines."""
-        ts = time.time()
-        entry = get_provider_health_entry(self.base_url, "provider-sim", timeout=1.0)
+    def _snapshot_from_entry(self, entry: Optional[dict], ts: float) -> HealthSnapshot:
+        """Reduce a provider health entry to the compact snapshot used by predicates and timelines."""
         if entry is None:
-            return {
-                "t": ts,
-                "present": False,
-                "state": "MISSING",
-                "attempt_count": None,
-                "crash_detected": None,
-                "circuit_open": None,
-                "max_attempts": None,
-                "next_restart_in_ms": None,
-                "uptime_seconds": None,
-                "device_count": None,
-            }
+            return _MISSING_SNAPSHOT._replace(t=ts)
 
         supervision = entry.get("supervision") or {}
-        return {
-            "t": ts,
-            "present": True,
-            "state": entry.get("state"),
-            "attempt_count": supervision.get("attempt_count"),
-            "crash_detected": supervision.get("crash_detected"),
-            "circuit_open": supervision.get("circuit_open"),
-            "max_attempts": supervision.get("max_attempts"),
-            "next_restart_in_ms": supervision.get("next_restart_in_ms"),
-            "uptime_seconds": entry.get("uptime_seconds"),
-            "device_count": entry.get("device_count"),
-        }
+        state = entry.get("state")
+        return HealthSnapshot(
+            t=ts,
+            present=True,
+            # Interned so predicate comparisons against the state literals hit the identity fast path
+            state=sys.intern(state) if isinstance(state, str) else state,
+            attempt_count=supervision.get("attempt_count"),
+            crash_detected=supervision.get("crash_detected"),
+            circuit_open=supervision.get("circuit_open"),
+            max_attempts=supervision.get("max_attempts"),
+            next_restart_in_ms=supervision.get("next_restart_in_ms"),
+            uptime_seconds=entry.get("uptime_seconds"),
+            device_count=entry.get("device_count"),
+        )
 
-    def _wait_for_snapshot_predicate(self, predicate, timeout: float, interval: float = 0.1):
+    def _wait_for_snapshot_predicate(
+        self,
+        predicate: Callable[[HealthSnapshot], bool],
+        timeout: float,
+        min_interval: float = 0.01,
+        max_interval: float = 0.2,
+        growth: float = 1.3,
+        history: int = 200,
+    ):
         """
-        Poll provider health until predicate(snapshot) is true.
-        Returns (matched: bool, snapshots: list[dict]).
+        Sample provider health until predicate(snapshot) is true.
+
+        Samples are driven by provider_health_change SSE events plus an adaptive schedule
+        (min_interval after each state/attempt/circuit transition, growing by growth up to
+        max_interval). Timing assertions read snapshot "t" at transition boundaries, so the
+        schedule does not bias them.
+        Only the last `history` samples are kept for the failure timeline, so long waits stay
+        bounded in memory.
+        Returns (matched: bool, snapshots: list[HealthSnapshot]).
         """
-        snapshots = []
-        deadline = time.time() + timeout
-        while time.time() < deadline:
-            snap = self._sample_provider_health()
-            snapshots.append(snap)
-            if predicate(snap):
-                return True, snapshots
-            time.sleep(interval)
-        return False, snapshots
-
-    def _format_health_snapshots(self, snapshots: List[dict], tail: int = 40) -> str:
+        snapshots: Deque[HealthSnapshot] = deque(maxlen=history)
+        deadline = time.monotonic() + timeout
+        stream = stream_provider_health(
+            self.base_url,
+            "provider-sim",
+            deadline,
+            min_interval=min_interval,
+            max_interval=max_interval,
+            growth=growth,
+            session=self.http,
+        )
+        # closing() releases the event subscription as soon as the wait returns.
+        with closing(stream):
+            for entry in stream:
+                snap = self._snapshot_from_entry(entry, time.monotonic())
+                if predicate(snap):
+                    snapshots.append(snap)
+                    return True, list(snapshots)
+                snapshots.append(snap)
+        return False, list(snapshots)
+
+    def _format_health_snapshots(self, snapshots: List[HealthSnapshot], tail: int = 40) -> str:
         """Format compact health timeline for failure diagnostics."""
         if not snapshots:
             return "(no health snapshots captured)"
-        start_t = snapshots[0]["t"]
-        lines = []
+        start_t = snapshots[0].t
+        buf = io.StringIO()
         for snap in snapshots[-tail:]:
-            dt_ms = int((snap["t"] - start_t) * 1000)
-            lines.append(
-                f"+{dt_ms:5d}ms "
-                f"present={snap['present']} "
-                f"state={snap['state']} "
-                f"attempt={snap['attempt_count']} "
-                f"crash={snap['crash_detected']} "
-                f"circuit={snap['circuit_open']} "
-                f"max={snap['max_attempts']} "
-                f"next={snap['next_restart_in_ms']} "
-                f"uptime={snap['uptime_seconds']} "
-                f"devices={snap['device_count']}"
+            buf.write(
+                "+%5dms present=%s state=%s attempt=%s crash=%s circuit=%s max=%s next=%s uptime=%s devices=%s\n"
+                % ((int((snap.t - start_t) * 1000),) + snap[1:])
             )
-        return "\n".join(lines)
+        return buf.getvalue().rstrip("\n")
 
     def _fail_with_output(
         self,
         name: str,
         message: str,
         tail_lines: int = 200,
-        health_snapshots: Optional[List[dict]] = None,
+        health_snapshots: Optional[List[HealthSnapshot]] = None,
     ) -> NoReturn:
         """Raise an assertion with recent runtime output context."""
         extra = ""
@@ -226,6 +294,28 @@ class SupervisionTester:
         output_tail = self.capture.get_recent_output(tail_lines)
         raise AssertionError(f"{name}: {message}{extra}\nOutput tail:\n{output_tail}")
 
+    def _start_until_crash(self, name: str, config_dict: dict, crash_timeout: float) -> None:
+        """
+        Shared crash-test scaffold: start runtime, await initial availability, then the crash banner.
+
+        The provider crash banner (provider stderr) is a timing trigger only, not a pass/fail oracle;
+        callers assert on supervision state via the health API afterwards.
+
+        Args:
+            name: Test name used in failure messages
+            config_dict: Runtime config (typically from create_config)
+            crash_timeout: Seconds to wait for the provider crash banner
+        """
+        self.start_runtime(config_dict, wait_for_http=False)
+
+        if not assert_provider_available(
+            self.base_url, "provider-sim", timeout=10.0, session=self.http, interval=READY_POLL_INTERVAL_S
+        ):
+            self._fail_with_output(name, "Provider not available at startup")
+
+        if self.capture:
+            self.capture.wait_for_marker("CRASHING NOW (exit 42)", timeout=crash_timeout)
+
     def test_automatic_restart(self) -> None:
         """Test that provider restarts automatically after crash."""
         print("\n[TEST] Automatic Restart")
@@ -233,23 +323,13 @@ class SupervisionTester:
         config_dict = self.create_config(crash_after=2.0, max_attempts=3, backoff_ms=[200, 500, 1000])
 
         try:
-            self.start_runtime(config_dict)
-
-            # Wait for provider to be initially available.
-            if not assert_provider_available(self.base_url, "provider-sim", timeout=10.0):
-                self._fail_with_output("automatic_restart", "Provider not available at startup")
-
-            # Wait for the provider chaos crash banner (provider stderr — acceptable trigger,
-            # not a pass/fail oracle; just advances timing certainty).
-            if self.capture:
-                self.capture.wait_for_marker("CRASHING NOW (exit 42)", timeout=8.0)
+            self._start_until_crash("automatic_restart", config_dict, crash_timeout=8.0)
 
             # API oracle: crash/restart handling became visible in supervision fields.
             # This is durable and avoids dependence on very short transient states.
             crash_seen, crash_snaps = self._wait_for_snapshot_predicate(
-                lambda s: s["present"] and ((s["attempt_count"] or 0) >= 1 or s["crash_detected"] is True),
+                _crash_handled,
                 timeout=8.0,
-                interval=0.05,
             )
             if not crash_seen:
                 self._fail_with_output(
@@ -259,18 +339,12 @@ class SupervisionTester:
                 )
 
             # Keep transient "down" observation as diagnostic only.
-            down_observed = any((not s["present"]) or s["state"] == "UNAVAILABLE" for s in crash_snaps)
+            down_observed = any(_went_down(s) for s in crash_snaps)
 
             # API oracle: provider recovered — AVAILABLE and attempt_count reset to 0.
             recovered, rec_snaps = self._wait_for_snapshot_predicate(
-                lambda s: (
-                    s["present"]
-                    and s["state"] == "AVAILABLE"
-                    and s["crash_detected"] is False
-                    and (s["next_restart_in_ms"] == 0 or s["next_restart_in_ms"] is None)
-                ),
+                _recovered_clean,
                 timeout=10.0,
-                interval=0.05,
             )
             if not recovered:
                 self._fail_with_output(
@@ -299,34 +373,13 @@ class SupervisionTester:
         config_dict = self.create_config(crash_after=1.0, max_attempts=3, backoff_ms=[500, 1000, 2000])
 
         try:
-            self.start_runtime(config_dict)
-
-            # Wait for provider to be initially available.
-            if not assert_provider_available(self.base_url, "provider-sim", timeout=10.0):
-                self._fail_with_output("backoff_timing", "Provider not available at startup")
-
-            # Use provider crash banner as timing trigger only (provider stderr, not runtime oracle).
-            if self.capture:
-                self.capture.wait_for_marker("CRASHING NOW (exit 42)", timeout=6.0)
-
-            # API oracle: confirm max_attempts reflects configured policy.
-            entry = get_provider_health_entry(self.base_url, "provider-sim")
-            if entry is None:
-                self._fail_with_output("backoff_timing", "Could not query provider health")
-
-            actual_max = entry["supervision"]["max_attempts"]
-            if actual_max != 3:
-                self._fail_with_output(
-                    "backoff_timing",
-                    f"Unexpected max_attempts in supervision: {actual_max} (expected 3)",
-                )
+            self._start_until_crash("backoff_timing", config_dict, crash_timeout=6.0)
 
             # Measure wall-clock from first crash-attempt state to stable recovery.
             # Avoid hard dependency on transient UNAVAILABLE visibility.
             crash_seen, crash_snaps = self._wait_for_snapshot_predicate(
-                lambda s: s["present"] and ((s["attempt_count"] or 0) >= 1 or s["crash_detected"] is True),
+                _crash_handled,
                 timeout=8.0,
-                interval=0.05,
             )
             if not crash_seen:
                 self._fail_with_output(
@@ -335,25 +388,28 @@ class SupervisionTester:
                     health_snapshots=crash_snaps,
                 )
 
+            # API oracle: confirm max_attempts reflects configured policy (read from the
+            # matching snapshot rather than a separate health request).
+            actual_max = crash_snaps[-1].max_attempts
+            if actual_max != 3:
+                self._fail_with_output(
+                    "backoff_timing",
+                    f"Unexpected max_attempts in supervision: {actual_max} (expected 3)",
+                )
+
             # Verify restart scheduling metadata is available while handling crash.
-            if crash_snaps[-1].get("next_restart_in_ms") is None:
+            if crash_snaps[-1].next_restart_in_ms is None:
                 self._fail_with_output(
                     "backoff_timing",
                     "Crash-attempt state missing next_restart_in_ms metadata",
                     health_snapshots=crash_snaps,
                 )
 
-            t_crash_state = crash_snaps[-1]["t"]
+            t_crash_state = crash_snaps[-1].t
 
             recovered, rec_snaps = self._wait_for_snapshot_predicate(
-                lambda s: (
-                    s["present"]
-                    and s["state"] == "AVAILABLE"
-                    and s["crash_detected"] is False
-                    and (s["next_restart_in_ms"] == 0 or s["next_restart_in_ms"] is None)
-                ),
+                _recovered_clean,
                 timeout=10.0,
-                interval=0.05,
             )
             if not recovered:
                 self._fail_with_output(
@@ -361,7 +417,7 @@ class SupervisionTester:
                     "Provider did not recover",
                     health_snapshots=crash_snaps + rec_snaps,
                 )
-            t_recovered = rec_snaps[-1]["t"]
+            t_recovered = rec_snaps[-1].t
 
             elapsed_ms = (t_recovered - t_crash_state) * 1000
 
@@ -404,9 +460,8 @@ class SupervisionTester:
 
             # API oracle: wait for circuit breaker to open.
             saw_crash, crash_snaps = self._wait_for_snapshot_predicate(
-                lambda s: s["present"] and ((s["attempt_count"] or 0) >= 1 or s["crash_detected"] is True),
+                _crash_handled,
                 timeout=12.0,
-                interval=0.05,
             )
             if not saw_crash:
                 self._fail_with_output(
@@ -416,9 +471,8 @@ class SupervisionTester:
                 )
 
             opened, circuit_snaps = self._wait_for_snapshot_predicate(
-                lambda s: s["present"] and s["circuit_open"] is True,
+                _circuit_opened,
                 timeout=15.0,
-                interval=0.05,
             )
             if not opened:
                 self._fail_with_output(
@@ -427,27 +481,26 @@ class SupervisionTester:
                     health_snapshots=crash_snaps + circuit_snaps,
                 )
 
-            # Verify final supervision state.
-            entry = get_provider_health_entry(self.base_url, "provider-sim")
-            if entry is None:
-                self._fail_with_output("circuit_breaker", "Failed to query provider health after circuit open")
-
-            if entry["state"] != "UNAVAILABLE":
+            # Verify final supervision state from the circuit-open snapshot itself.
+            final = circuit_snaps[-1]
+            if final.state != "UNAVAILABLE":
                 self._fail_with_output(
                     "circuit_breaker",
-                    f"Expected UNAVAILABLE after circuit open, got {entry['state']}",
+                    f"Expected UNAVAILABLE after circuit open, got {final.state}",
+                    health_snapshots=circuit_snaps,
                 )
 
-            attempt_count = entry["supervision"]["attempt_count"]
+            attempt_count = final.attempt_count or 0
             if attempt_count < 3:  # max_attempts=2 → circuit opens on 3rd crash
                 self._fail_with_output(
                     "circuit_breaker",
                     f"Expected attempt_count >= 3 when circuit opens, got {attempt_count}",
+                    health_snapshots=circuit_snaps,
                 )
 
             print(
                 "  [INFO] circuit_breaker: opened after "
-                f"{attempt_count} attempts (next_restart_in_ms={entry['supervision']['next_restart_in_ms']})"
+                f"{attempt_count} attempts (next_restart_in_ms={final.next_restart_in_ms})"
             )
 
         finally:
@@ -504,8 +557,8 @@ class SupervisionTester:
                         "args": [
                             str(wrapper_path).replace("\\", "/"),
                             str(counter_path).replace("\\", "/"),
-                            str(self.provider_sim_path).replace("\\", "/"),
-                            self._default_provider_fixture_config(),
+                            self._provider_cmd,
+                            self._fixture_config,
                         ],
                         "timeout_ms": 1500,
                         "restart_policy": {
@@ -518,13 +571,15 @@ class SupervisionTester:
                     }
                 ],
                 "polling": {"interval_ms": 200},
-                "logging": {"level": "info"},
+                "logging": {"level": "info", "format": "jsonl"},
             }
 
             try:
-                self.start_runtime(config_dict)
+                self.start_runtime(config_dict, wait_for_http=False)
 
-                if not assert_provider_available(self.base_url, "provider-sim", timeout=10.0):
+                if not assert_provider_available(
+                    self.base_url, "provider-sim", timeout=10.0, session=self.http, interval=READY_POLL_INTERVAL_S
+                ):
                     self._fail_with_output(
                         "failed_restart_continuity",
                         "Provider did not become available before induced crash",
@@ -534,9 +589,8 @@ class SupervisionTester:
                     self.capture.wait_for_marker("WRAPPER_FAIL_ATTEMPT_2", timeout=10.0)
 
                 crash_seen, crash_snaps = self._wait_for_snapshot_predicate(
-                    lambda s: s["present"] and ((s["attempt_count"] or 0) >= 1 or s["crash_detected"] is True),
+                    _crash_handled,
                     timeout=8.0,
-                    interval=0.05,
                 )
                 if not crash_seen:
                     self._fail_with_output(
@@ -548,9 +602,8 @@ class SupervisionTester:
                 # Continuity assertion: failed restart attempts must keep provider visible
                 # as supervised UNAVAILABLE state instead of disappearing from health API.
                 still_supervised, supervised_snaps = self._wait_for_snapshot_predicate(
-                    lambda s: s["present"] and s["state"] == "UNAVAILABLE" and (s["attempt_count"] or 0) >= 1,
+                    lambda s: s.present and s.state == "UNAVAILABLE" and (s.attempt_count or 0) >= 1,
                     timeout=8.0,
-                    interval=0.05,
                 )
                 if not still_supervised:
                     self._fail_with_output(
@@ -560,14 +613,8 @@ class SupervisionTester:
                     )
 
                 recovered, rec_snaps = self._wait_for_snapshot_predicate(
-                    lambda s: (
-                        s["present"]
-                        and s["state"] == "AVAILABLE"
-                        and (s["device_count"] or 0) > 0
-                        and (s["attempt_count"] or 0) == 0
-                    ),
+                    _recovered_with_reset_attempts,
                     timeout=15.0,
-                    interval=0.05,
                 )
                 if not recovered:
                     self._fail_with_output(
@@ -630,8 +677,8 @@ class SupervisionTester:
                         "args": [
                             str(wrapper_path).replace("\\", "/"),
                             str(counter_path).replace("\\", "/"),
-                            str(self.provider_sim_path).replace("\\", "/"),
-                            self._default_provider_fixture_config(),
+                            self._provider_cmd,
+                            self._fixture_config,
                         ],
                         "timeout_ms": 1500,
                         "restart_policy": {
@@ -644,33 +691,38 @@ class SupervisionTester:
                     }
                 ],
                 "polling": {"interval_ms": 200},
-                "logging": {"level": "info"},
+                "logging": {"level": "info", "format": "jsonl"},
             }
 
             try:
-                self.start_runtime(config_dict)
+                self.start_runtime(config_dict, wait_for_http=False)
 
-                if not assert_provider_available(self.base_url, "provider-sim", timeout=10.0):
+                if not assert_provider_available(
+                    self.base_url, "provider-sim", timeout=10.0, session=self.http, interval=READY_POLL_INTERVAL_S
+                ):
                     self._fail_with_output(
                         "restart_timeout_enforced",
                         "Provider did not become available before induced crash",
                     )
 
-                delayed_attempt_seen = False
+                # Await only the final log event; the delayed wrapper attempt necessarily precedes it,
+                # so it is confirmed from the already-captured buffer instead of a second wait.
+                timeout_seen = False
                 if self.capture:
-                    delayed_attempt_seen = self.capture.wait_for_marker("WRAPPER_DELAY_ATTEMPT_2", timeout=10.0)
+                    timeout_seen = (
+                        self.capture.wait_for_log(
+                            "ERROR",
+                            "Restart timeout exceeded for provider 'provider-sim' after start()",
+                            timeout=25.0,
+                        )
+                        is not None
+                    )
+                delayed_attempt_seen = bool(self.capture) and "WRAPPER_DELAY_ATTEMPT_2" in self.capture.get_all_output()
                 if not delayed_attempt_seen:
                     self._fail_with_output(
                         "restart_timeout_enforced",
                         "Did not observe delayed restart wrapper attempt",
                     )
-
-                timeout_seen = False
-                if self.capture:
-                    timeout_seen = self.capture.wait_for_marker(
-                        "Restart timeout exceeded for provider 'provider-sim' after start()",
-                        timeout=15.0,
-                    )
                 if not timeout_seen:
                     self._fail_with_output(
                         "restart_timeout_enforced",
@@ -678,14 +730,8 @@ class SupervisionTester:
                     )
 
                 recovered, rec_snaps = self._wait_for_snapshot_predicate(
-                    lambda s: (
-                        s["present"]
-                        and s["state"] == "AVAILABLE"
-                        and (s["device_count"] or 0) > 0
-                        and (s["attempt_count"] or 0) == 0
-                    ),
+                    _recovered_with_reset_attempts,
                     timeout=15.0,
-                    interval=0.05,
                 )
                 if not recovered:
                     self._fail_with_output(
@@ -736,8 +782,8 @@ class SupervisionTester:
                         "command": sys.executable,
                         "args": [
                             str(wrapper_path).replace("\\", "/"),
-                            str(self.provider_sim_path).replace("\\", "/"),
-                            self._default_provider_fixture_config(),
+                            self._provider_cmd,
+                            self._fixture_config,
                         ],
                         "timeout_ms": 1500,
                         # Keep hello timeout above runtime.startup_timeout_ms so this
@@ -753,7 +799,7 @@ class SupervisionTester:
                     }
                 ],
                 "polling": {"interval_ms": 200},
-                "logging": {"level": "info"},
+                "logging": {"level": "info", "format": "jsonl"},
             }
 
             self.fixture = RuntimeFixture(
@@ -777,9 +823,8 @@ class SupervisionTester:
 
                 timeout_reported = False
                 if self.capture:
-                    timeout_reported = self.capture.wait_for_marker(
-                        "Runtime startup timeout exceeded",
-                        timeout=2.0,
+                    timeout_reported = (
+                        self.capture.wait_for_log("ERROR", "Runtime startup timeout exceeded", timeout=2.0) is not None
                     )
                 if not timeout_reported:
                     self._fail_with_output(
@@ -796,21 +841,12 @@ class SupervisionTester:
         config_dict = self.create_config(crash_after=2.0, max_attempts=3, backoff_ms=[200, 500, 1000])
 
         try:
-            self.start_runtime(config_dict)
-
-            # API oracle: wait for provider to be initially AVAILABLE with devices.
-            if not assert_provider_available(self.base_url, "provider-sim", timeout=10.0):
-                self._fail_with_output("device_rediscovery", "Provider not available at startup")
-
-            # Use provider crash banner as timing trigger only.
-            if self.capture:
-                self.capture.wait_for_marker("CRASHING NOW (exit 42)", timeout=8.0)
+            self._start_until_crash("device_rediscovery", config_dict, crash_timeout=8.0)
 
             # API oracle: provider goes down after crash (UNAVAILABLE or temporarily missing during restart).
             went_down, down_snaps = self._wait_for_snapshot_predicate(
-                lambda s: (not s["present"]) or s["state"] == "UNAVAILABLE",
+                _went_down,
                 timeout=8.0,
-                interval=0.05,
             )
             if not went_down:
                 self._fail_with_output(
@@ -823,9 +859,9 @@ class SupervisionTester:
             # Require consecutive matching samples to avoid transition-edge races.
             stable_recovery_hits = 0
 
-            def recovered_with_devices(snap: dict) -> bool:
+            def recovered_with_devices(snap: HealthSnapshot) -> bool:
                 nonlocal stable_recovery_hits
-                ready = snap["present"] and snap["state"] == "AVAILABLE" and (snap["device_count"] or 0) > 0
+                ready = snap.present and snap.state == "AVAILABLE" and (snap.device_count or 0) > 0
                 if ready:
                     stable_recovery_hits += 1
                 else:
@@ -835,7 +871,6 @@ class SupervisionTester:
             recovered, rec_snaps = self._wait_for_snapshot_predicate(
                 recovered_with_devices,
                 timeout=12.0,
-                interval=0.05,
             )
             if not recovered:
                 self._fail_with_output(
@@ -844,7 +879,42 @@ class SupervisionTester:
                     health_snapshots=rec_snaps,
                 )
 
-            print(f"  [INFO] device_rediscovery: recovered with device_count={rec_snaps[-1].get('device_count', 0)}")
+            # The matching snapshot already carries the rediscovered device count (> 0 per predicate).
+            print(f"  [INFO] device_rediscovery: recovered with device_count={rec_snaps[-1].device_count}")
+
+        finally:
+            self.stop_runtime()
+
+    def test_health_stream_released(self) -> None:
+        """Test that a finished health wait closes its event subscription promptly."""
+        print("\n[TEST] Health Stream Released")
+
+        config_dict = self.create_config(crash_after=60.0)
+
+        try:
+            self.start_runtime(config_dict, wait_for_http=False)
+
+            if not assert_provider_available(
+                self.base_url, "provider-sim", timeout=10.0, session=self.http, interval=READY_POLL_INTERVAL_S
+            ):
+                self._fail_with_output("health_stream_released", "Provider not available at startup")
+
+            available, snaps = self._wait_for_snapshot_predicate(_recovered_clean, timeout=5.0)
+            if not available:
+                self._fail_with_output(
+                    "health_stream_released",
+                    "Provider health was not observed",
+                    health_snapshots=snaps,
+                )
+
+            # The watcher is parked on the idle stream (no events follow), so it only exits
+            # here if the wait closed the connection rather than waiting for the keep-alive.
+            watchers = [t for t in threading.enumerate() if t.name.startswith(HEALTH_WATCHER_THREAD_PREFIX)]
+            if watchers:
+                self._fail_with_output(
+                    "health_stream_released",
+                    f"Health event watcher still running after the wait returned: {[t.name for t in watchers]}",
+                )
 
         finally:
             self.stop_runtime()
@@ -860,4 +930,5 @@ SUPERVISION_CHECKS: List[SupervisionCheck] = [
     ("restart_timeout_enforced", SupervisionTester.test_restart_timeout_enforced),
     ("startup_timeout_enforced", SupervisionTester.test_startup_timeout_enforced),
     ("device_rediscovery", SupervisionTester.test_device_rediscovery),
+    ("health_stream_released", SupervisionTester.test_health_stream_released),
 ]
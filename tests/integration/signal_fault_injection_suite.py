@@ -26,13 +26,16 @@ from tests.support.api_helpers import wait_for_condition
 
 REQUEST_TIMEOUT_S = 5.0
 
+# Every step hits the same runtime, so requests share keep-alive connections (see simulation_devices_suite).
+_SESSION = requests.Session()
+
 
 def _find_signal(state: dict[str, Any], candidates: list[str]) -> dict[str, Any] | None:
     values = cast(list[dict[str, Any]], state.get("values", []))
+    by_id = {signal.get("signal_id"): signal for signal in values}
     for signal_id in candidates:
-        for signal in values:
-            if signal.get("signal_id") == signal_id:
-                return signal
+        if signal_id in by_id:
+            return by_id[signal_id]
     return None
 
 
@@ -40,7 +43,7 @@ def test_signal_fault_injection(base_url: str) -> None:
     """Test that signal fault injection overrides signal quality to FAULT."""
 
     # Step 1: Read baseline signal value
-    response = requests.get(f"{base_url}/v0/state/sim0/tempctl0", timeout=REQUEST_TIMEOUT_S)
+    response = _SESSION.get(f"{base_url}/v0/state/sim0/tempctl0", timeout=REQUEST_TIMEOUT_S)
     if response.status_code != 200:
         raise AssertionError(f"Could not read device state: {response.status_code}")
 
@@ -54,7 +57,7 @@ def test_signal_fault_injection(base_url: str) -> None:
     target_signal_id = baseline_signal["signal_id"]
 
     # Step 2: Inject signal fault
-    response = requests.post(
+    response = _SESSION.post(
         f"{base_url}/v0/call",
         json={
             "provider_id": "sim0",
@@ -81,7 +84,7 @@ def test_signal_fault_injection(base_url: str) -> None:
 
     def fault_visible() -> bool:
         nonlocal latest_quality
-        resp = requests.get(f"{base_url}/v0/state/sim0/tempctl0", timeout=REQUEST_TIMEOUT_S)
+        resp = _SESSION.get(f"{base_url}/v0/state/sim0/tempctl0", timeout=REQUEST_TIMEOUT_S)
         if resp.status_code != 200:
             return False
         current_state = resp.json()
@@ -97,7 +100,7 @@ def test_signal_fault_injection(base_url: str) -> None:
     # Step 4: Verify quality remains FAULT while fault is active
     time.sleep(1.0)
 
-    response = requests.get(f"{base_url}/v0/state/sim0/tempctl0", timeout=REQUEST_TIMEOUT_S)
+    response = _SESSION.get(f"{base_url}/v0/state/sim0/tempctl0", timeout=REQUEST_TIMEOUT_S)
     state = response.json()
     frozen_signal = _find_signal(state, [target_signal_id])
     if not frozen_signal:
@@ -107,7 +110,7 @@ def test_signal_fault_injection(base_url: str) -> None:
         raise AssertionError(f"Quality should still be FAULT after 1s, got: {frozen_signal['quality']}")
 
     # Step 5: Clear faults and verify recovery
-    response = requests.post(
+    response = _SESSION.post(
         f"{base_url}/v0/call",
         json={
             "provider_id": "sim0",
@@ -126,7 +129,7 @@ def test_signal_fault_injection(base_url: str) -> None:
 
     def quality_recovered() -> bool:
         nonlocal latest_quality
-        resp = requests.get(f"{base_url}/v0/state/sim0/tempctl0", timeout=REQUEST_TIMEOUT_S)
+        resp = _SESSION.get(f"{base_url}/v0/state/sim0/tempctl0", timeout=REQUEST_TIMEOUT_S)
         if resp.status_code != 200:
             return False
         current_state = resp.json()
@@ -14,23 +14,26 @@ Tests:
 
 from __future__ import annotations
 
+import os
 import signal
+import subprocess
 import sys
-import time
 from pathlib import Path
 
 from tests.support.runtime_fixture import RuntimeFixture
 
+# Same for every case; only the HTTP port and the provider binary vary per test.
+_PROVIDER_FIXTURE_CONFIG = str(Path(__file__).parent / "fixtures" / "provider-sim-default.yaml").replace("\\", "/")
+
 
 def test_signal_handling(
     runtime_path: str,
     provider_path: str,
     test_signal: signal.Signals,
-    signal_name: str,
     port: int,
 ) -> None:
     """Verify runtime responds to signal and shuts down cleanly."""
-    fixture_config = Path(__file__).parent / "fixtures" / "provider-sim-default.yaml"
+    signal_name = test_signal.name
     config = {
         "runtime": {},
         "http": {"enabled": True, "bind": "127.0.0.1", "port": port},
@@ -38,7 +41,7 @@ def test_signal_handling(
             {
                 "id": "sim",
                 "command": str(provider_path).replace("\\", "/"),
-                "args": ["--config", str(fixture_config).replace("\\", "/")],
+                "args": ["--config", _PROVIDER_FIXTURE_CONFIG],
             }
         ],
         "polling": {"interval_ms": 1000},
@@ -58,23 +61,25 @@ def test_signal_handling(
             output_tail = capture.get_recent_output(80)
             raise AssertionError(f"Runtime did not become ready within 15s\nOutput tail:\n{output_tail}")
 
-        time.sleep(0.5)
+        # No settle delay: main() installs the signal handler before logging "Runtime Ready", and a
+        # shutdown request latched before runtime.run() starts is honoured on its first loop pass.
 
         proc_info = fixture.process_info
         assert proc_info is not None and proc_info.process is not None, "No process info available"
         proc = proc_info.process
 
+        # Signal the runtime's whole process group (it is a session leader, provider-sim included),
+        # as a terminal Ctrl+C or a service manager stop would; CTRL_BREAK_EVENT is group-wide too.
         if sys.platform == "win32":
             proc.send_signal(signal.CTRL_BREAK_EVENT)
         else:
-            proc.send_signal(test_signal)
-
-        start_time = time.time()
-        timeout = 5.0
-        while time.time() - start_time < timeout:
-            if not fixture.is_running():
-                break
-            time.sleep(0.1)
+            os.killpg(proc_info.process_group_id, test_signal)
+
+        # Popen.wait polls with its own short backoff, so a prompt exit is seen within milliseconds.
+        try:
+            proc.wait(timeout=5.0)
+        except subprocess.TimeoutExpired:
+            pass
 
         assert not fixture.is_running(), f"Runtime hung after {signal_name} (timeout after 5s)"
 
@@ -14,20 +14,66 @@ Requires:
 
 """
 
+import json
 import time
+from typing import Any, Callable, Dict, List, Optional
 
 import requests
 
-from tests.support.api_helpers import wait_for_condition
+from tests.support.api_helpers import decode_json, wait_for_condition
 
 REQUEST_TIMEOUT_S = 5.0
 
+# Keep-alive connections shared by every check in this module; urllib3 pools per host:port,
+# so each test's runtime gets its own pool and connections to exited runtimes are discarded.
+_SESSION = requests.Session()
+
+# Call bodies reused across checks, serialized once and posted as raw JSON.
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _call_body(device_id: str, function_id: int, args: dict) -> bytes:
+    return json.dumps(
+        {"provider_id": "sim0", "device_id": device_id, "function_id": function_id, "args": args}
+    ).encode()
+
+
+CLEAR_FAULTS_BODY = _call_body("chaos_control", 5, {})
+RELAY_CH1_ON_BODY = _call_body("relayio0", 1, {"enabled": {"type": "bool", "bool": True}})
+RELAY_CH1_OFF_BODY = _call_body("relayio0", 1, {"enabled": {"type": "bool", "bool": False}})
+NOISE_ON_BODY = _call_body("analogsensor0", 2, {"enabled": {"type": "bool", "bool": True}})
+NOISE_OFF_BODY = _call_body("analogsensor0", 2, {"enabled": {"type": "bool", "bool": False}})
+
+
+def _signals_by_id(state: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Index a device state response's values by signal_id."""
+    return {s["signal_id"]: s for s in state["values"]}
+
+
+def _wait_for_state(
+    base_url: str, device_id: str, predicate: Callable[[Dict[str, Any]], bool], timeout: float
+) -> Optional[Dict[str, Any]]:
+    """Poll a sim0 device's state until predicate holds; return that parsed state, or None on timeout."""
+    matched: List[Dict[str, Any]] = []
+
+    def check() -> bool:
+        resp = _SESSION.get(f"{base_url}/v0/state/sim0/{device_id}", timeout=REQUEST_TIMEOUT_S)
+        state = decode_json(resp)
+        if predicate(state):
+            matched.append(state)
+            return True
+        return False
+
+    if wait_for_condition(check, timeout=timeout, description=f"{device_id} state"):
+        return matched[-1]
+    return None
+
 
 def test_device_discovery(base_url: str) -> None:
     """Test that all 5 devices are discovered."""
     print("\n=== TEST: Device Discovery ===")
-    resp = requests.get(f"{base_url}/v0/devices", timeout=REQUEST_TIMEOUT_S)
-    devices = resp.json().get("devices", [])
+    resp = _SESSION.get(f"{base_url}/v0/devices", timeout=REQUEST_TIMEOUT_S)
+    devices = decode_json(resp).get("devices", [])
 
     expected_devices = [
         "tempctl0",
@@ -51,45 +97,29 @@ def test_relayio0(base_url: str) -> None:
     print("\n=== TEST: relayio0 Device (Bool Signals) ===")
 
     # Read initial state
-    resp = requests.get(f"{base_url}/v0/state/sim0/relayio0", timeout=REQUEST_TIMEOUT_S)
-    state = resp.json()
+    resp = _SESSION.get(f"{base_url}/v0/state/sim0/relayio0", timeout=REQUEST_TIMEOUT_S)
+    state = decode_json(resp)
     print(f"  Signals: {len(state['values'])}")
 
-    relay1_before = next((s for s in state["values"] if s["signal_id"] == "relay_ch1_state"), None)
+    relay1_before = _signals_by_id(state).get("relay_ch1_state")
     if not relay1_before:
         raise AssertionError("Could not find relay_ch1_state signal")
     print(f"  relay_ch1_state: {relay1_before['value']['bool']}")
 
     # Toggle relay
-    call_body = {
-        "provider_id": "sim0",
-        "device_id": "relayio0",
-        "function_id": 1,
-        "args": {"enabled": {"type": "bool", "bool": True}},
-    }
-    resp = requests.post(f"{base_url}/v0/call", json=call_body, timeout=REQUEST_TIMEOUT_S)
-    result = resp.json()
+    resp = _SESSION.post(f"{base_url}/v0/call", data=RELAY_CH1_ON_BODY, headers=JSON_HEADERS, timeout=REQUEST_TIMEOUT_S)
+    result = decode_json(resp)
 
     if result["status"]["code"] != "OK":
         raise AssertionError(f"Function call failed: {result['status']['message']}")
 
-    # Verify state changed (wait for poll)
-    def check_relay():
-        resp = requests.get(f"{base_url}/v0/state/sim0/relayio0", timeout=REQUEST_TIMEOUT_S)
-        state = resp.json()
-        val = next((s for s in state["values"] if s["signal_id"] == "relay_ch1_state"), None)
-        return val and val["value"]["bool"]
-
-    wait_for_condition(check_relay, timeout=2.0)
-
-    resp = requests.get(f"{base_url}/v0/state/sim0/relayio0", timeout=REQUEST_TIMEOUT_S)
-    state = resp.json()
-    relay1_after = next((s for s in state["values"] if s["signal_id"] == "relay_ch1_state"), None)
+    # Verify state changed (wait for poll); the matching poll doubles as the final read
+    def relay1_on(state: Dict[str, Any]) -> bool:
+        val = _signals_by_id(state).get("relay_ch1_state")
+        return bool(val and val["value"]["bool"])
 
-    if not relay1_after:
-        raise AssertionError("Could not find relay_ch1_state signal after toggle")
-
-    assert relay1_after["value"]["bool"], "Relay did not toggle"
+    state_after = _wait_for_state(base_url, "relayio0", relay1_on, timeout=2.0)
+    assert state_after is not None, "Relay did not toggle (relay_ch1_state not true within 2s)"
     print("  [PASS] Relay toggled successfully")
 
 
@@ -98,11 +128,12 @@ def test_analogsensor0(base_url: str) -> None:
     print("\n=== TEST: analogsensor0 Device (Double Signals + Quality) ===")
 
     # Read initial state
-    resp = requests.get(f"{base_url}/v0/state/sim0/analogsensor0", timeout=REQUEST_TIMEOUT_S)
-    state = resp.json()
+    resp = _SESSION.get(f"{base_url}/v0/state/sim0/analogsensor0", timeout=REQUEST_TIMEOUT_S)
+    state = decode_json(resp)
 
-    voltage_ch1 = next((s for s in state["values"] if s["signal_id"] == "voltage_ch1"), None)
-    quality = next((s for s in state["values"] if s["signal_id"] == "sensor_quality"), None)
+    signals = _signals_by_id(state)
+    voltage_ch1 = signals.get("voltage_ch1")
+    quality = signals.get("sensor_quality")
 
     if not voltage_ch1:
         raise AssertionError("Could not find voltage_ch1 signal")
@@ -113,14 +144,8 @@ def test_analogsensor0(base_url: str) -> None:
     print(f"  sensor_quality: {quality['value']['string']}")
 
     # Inject noise
-    call_body = {
-        "provider_id": "sim0",
-        "device_id": "analogsensor0",
-        "function_id": 2,
-        "args": {"enabled": {"type": "bool", "bool": True}},
-    }
-    resp = requests.post(f"{base_url}/v0/call", json=call_body, timeout=REQUEST_TIMEOUT_S)
-    result = resp.json()
+    resp = _SESSION.post(f"{base_url}/v0/call", data=NOISE_ON_BODY, headers=JSON_HEADERS, timeout=REQUEST_TIMEOUT_S)
+    result = decode_json(resp)
     if result["status"]["code"] != "OK":
         raise AssertionError(f"inject_noise failed: {result['status']['message']}")
 
@@ -128,9 +153,9 @@ def test_analogsensor0(base_url: str) -> None:
     # Keep this suite fast: verify contract and data flow instead of waiting for long drift.
     time.sleep(0.6)
 
-    resp = requests.get(f"{base_url}/v0/state/sim0/analogsensor0", timeout=REQUEST_TIMEOUT_S)
-    state = resp.json()
-    quality_after = next((s for s in state["values"] if s["signal_id"] == "sensor_quality"), None)
+    resp = _SESSION.get(f"{base_url}/v0/state/sim0/analogsensor0", timeout=REQUEST_TIMEOUT_S)
+    state = decode_json(resp)
+    quality_after = _signals_by_id(state).get("sensor_quality")
 
     if not quality_after:
         raise AssertionError("Could not find sensor_quality signal after noise")
@@ -143,25 +168,16 @@ def test_analogsensor0(base_url: str) -> None:
     # Confirm samples remain dynamic after enabling noise.
     samples: list[float] = []
     for _ in range(4):
-        resp = requests.get(f"{base_url}/v0/state/sim0/analogsensor0", timeout=REQUEST_TIMEOUT_S)
-        state = resp.json()
-        reading = next((s for s in state["values"] if s["signal_id"] == "voltage_ch1"), None)
+        resp = _SESSION.get(f"{base_url}/v0/state/sim0/analogsensor0", timeout=REQUEST_TIMEOUT_S)
+        state = decode_json(resp)
+        reading = _signals_by_id(state).get("voltage_ch1")
         if not reading:
             raise AssertionError("Missing voltage_ch1 during sampling")
         samples.append(float(reading["value"]["double"]))
         time.sleep(0.2)
 
     # Disable noise so following tests start from a clean baseline.
-    requests.post(
-        f"{base_url}/v0/call",
-        json={
-            "provider_id": "sim0",
-            "device_id": "analogsensor0",
-            "function_id": 2,
-            "args": {"enabled": {"type": "bool", "bool": False}},
-        },
-        timeout=REQUEST_TIMEOUT_S,
-    )
+    _SESSION.post(f"{base_url}/v0/call", data=NOISE_OFF_BODY, headers=JSON_HEADERS, timeout=REQUEST_TIMEOUT_S)
 
     if len(set(samples)) <= 1:
         raise AssertionError("voltage_ch1 samples did not change after noise enable")
@@ -173,14 +189,8 @@ def test_fault_injection_clear(base_url: str) -> None:
     """Test clear_faults function."""
     print("\n=== TEST: Fault Injection - clear_faults ===")
 
-    call_body = {
-        "provider_id": "sim0",
-        "device_id": "chaos_control",
-        "function_id": 5,
-        "args": {},
-    }
-    resp = requests.post(f"{base_url}/v0/call", json=call_body, timeout=REQUEST_TIMEOUT_S)
-    result = resp.json()
+    resp = _SESSION.post(f"{base_url}/v0/call", data=CLEAR_FAULTS_BODY, headers=JSON_HEADERS, timeout=REQUEST_TIMEOUT_S)
+    result = decode_json(resp)
 
     assert result["status"]["code"] == "OK", f"clear_faults failed: {result['status']['message']}"
     print("  [PASS] clear_faults succeeded")
@@ -194,8 +204,8 @@ def test_fault_injection_device_unavailable(base_url: str) -> None:
     test_fault_injection_clear(base_url)
 
     # Read baseline
-    resp = requests.get(f"{base_url}/v0/state/sim0/motorctl0", timeout=REQUEST_TIMEOUT_S)
-    baseline_values = len(resp.json()["values"])
+    resp = _SESSION.get(f"{base_url}/v0/state/sim0/motorctl0", timeout=REQUEST_TIMEOUT_S)
+    baseline_values = len(decode_json(resp)["values"])
     print(f"  Baseline: {baseline_values} signals")
 
     # Inject device unavailable
@@ -208,12 +218,12 @@ def test_fault_injection_device_unavailable(base_url: str) -> None:
             "duration_ms": {"type": "int64", "int64": 2000},
         },
     }
-    resp = requests.post(f"{base_url}/v0/call", json=call_body, timeout=REQUEST_TIMEOUT_S)
+    resp = _SESSION.post(f"{base_url}/v0/call", json=call_body, timeout=REQUEST_TIMEOUT_S)
 
     # Wait for state to reflect unavailability (may return empty values)
     def device_unavailable():
-        resp = requests.get(f"{base_url}/v0/state/sim0/motorctl0", timeout=REQUEST_TIMEOUT_S)
-        values = resp.json().get("values", [])
+        resp = _SESSION.get(f"{base_url}/v0/state/sim0/motorctl0", timeout=REQUEST_TIMEOUT_S)
+        values = decode_json(resp).get("values", [])
         return len(values) < baseline_values
 
     assert wait_for_condition(device_unavailable, timeout=2.0, description="device unavailable state"), (
@@ -224,8 +234,8 @@ def test_fault_injection_device_unavailable(base_url: str) -> None:
 
     # Clear faults after device becomes available again
     def device_restored():
-        resp = requests.get(f"{base_url}/v0/state/sim0/motorctl0", timeout=REQUEST_TIMEOUT_S)
-        values = resp.json().get("values", [])
+        resp = _SESSION.get(f"{base_url}/v0/state/sim0/motorctl0", timeout=REQUEST_TIMEOUT_S)
+        values = decode_json(resp).get("values", [])
         return len(values) >= baseline_values
 
     assert wait_for_condition(device_restored, timeout=3.0, description="device restoration"), (
@@ -251,17 +261,11 @@ def test_fault_injection_call_latency(base_url: str) -> None:
             "latency_ms": {"type": "int64", "int64": 1000},
         },
     }
-    requests.post(f"{base_url}/v0/call", json=call_body, timeout=REQUEST_TIMEOUT_S)
+    _SESSION.post(f"{base_url}/v0/call", json=call_body, timeout=REQUEST_TIMEOUT_S)
 
     # Make a call and measure time
     start = time.time()
-    call_body = {
-        "provider_id": "sim0",
-        "device_id": "relayio0",
-        "function_id": 1,
-        "args": {"enabled": {"type": "bool", "bool": False}},
-    }
-    requests.post(f"{base_url}/v0/call", json=call_body, timeout=REQUEST_TIMEOUT_S)
+    _SESSION.post(f"{base_url}/v0/call", data=RELAY_CH1_OFF_BODY, headers=JSON_HEADERS, timeout=REQUEST_TIMEOUT_S)
     elapsed = time.time() - start
 
     print(f"  Call took {elapsed:.2f}s (should be ~1s)")
@@ -291,17 +295,11 @@ def test_fault_injection_call_failure(base_url: str) -> None:
             "failure_rate": {"type": "double", "double": 1.0},
         },
     }
-    resp = requests.post(f"{base_url}/v0/call", json=call_body, timeout=REQUEST_TIMEOUT_S)
+    resp = _SESSION.post(f"{base_url}/v0/call", json=call_body, timeout=REQUEST_TIMEOUT_S)
 
     # Try to call the function - should fail
-    call_body = {
-        "provider_id": "sim0",
-        "device_id": "relayio0",
-        "function_id": 1,
-        "args": {"enabled": {"type": "bool", "bool": True}},
-    }
-    resp = requests.post(f"{base_url}/v0/call", json=call_body, timeout=REQUEST_TIMEOUT_S)
-    result = resp.json()
+    resp = _SESSION.post(f"{base_url}/v0/call", data=RELAY_CH1_ON_BODY, headers=JSON_HEADERS, timeout=REQUEST_TIMEOUT_S)
+    result = decode_json(resp)
 
     # Clear faults
     test_fault_injection_clear(base_url)
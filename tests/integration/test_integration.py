@@ -164,16 +164,9 @@ def test_process_cleanup_suite(runtime_exe: Path, provider_exe: Path, unique_por
 
 @pytest.mark.integration
 @pytest.mark.timeout(240)
-@pytest.mark.parametrize(
-    ("sig", "name"),
-    [
-        (signal.SIGINT, "SIGINT"),
-        (signal.SIGTERM, "SIGTERM"),
-    ],
-    ids=["sigint", "sigterm"],
-)
-def test_signal_handling_suite(runtime_exe: Path, provider_exe: Path, unique_port: int, sig, name) -> None:
-    signal_handling_suite.test_signal_handling(str(runtime_exe), str(provider_exe), sig, name, unique_port)
+@pytest.mark.parametrize("sig", [signal.SIGINT, signal.SIGTERM], ids=["sigint", "sigterm"])
+def test_signal_handling_suite(runtime_exe: Path, provider_exe: Path, unique_port: int, sig) -> None:
+    signal_handling_suite.test_signal_handling(str(runtime_exe), str(provider_exe), sig, unique_port)
 
 
 @pytest.mark.integration
@@ -8,15 +8,19 @@ Provides common infrastructure for validation scenarios:
 """
 
 import time
-from typing import Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from tests.support.api_helpers import (
     assert_mode as api_assert_mode,
 )
 from tests.support.api_helpers import (
     call_device_function,
+    function_ids_by_name,
 )
 from tests.support.api_helpers import (
     get_all_state as api_get_all_state,
@@ -49,6 +53,16 @@ class ScenarioBase:
     4. Clean up state in cleanup() or use try/finally
     """
 
+    # Read timeout for state/config requests and for device function calls (which may block on the device)
+    REQUEST_TIMEOUT_S = 5.0
+    CALL_TIMEOUT_S = 20.0
+    # How long a signal may take to reflect a device call, and the cap on the poll interval meanwhile
+    SIGNAL_PROPAGATION_TIMEOUT_S = 1.0
+    SIGNAL_POLL_INTERVAL_S = 0.05
+    # Connection failures never reach the runtime, so retrying them is safe for any method;
+    # HTTP error statuses are returned to the scenario untouched.
+    _CONNECT_RETRY = Retry(total=None, connect=2, read=0, status=0, other=0, redirect=0, backoff_factor=0.1)
+
     def __init__(self, base_url: str):
         """
         Initialize scenario with runtime base URL.
@@ -58,6 +72,18 @@ class ScenarioBase:
         """
         self.base_url = base_url.rstrip("/")
         self.name = self.__class__.__name__
+        # One keep-alive connection pool for every helper call this scenario makes
+        self.http = requests.Session()
+        self.http.mount("http://", HTTPAdapter(max_retries=self._CONNECT_RETRY))
+        # Capabilities are static for a device, so fetch them (and the function name index) once
+        self._capabilities: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._function_ids: Dict[Tuple[str, str], Dict[str, int]] = {}
+        # Wall-clock seconds of each call_function round trip, summarized by call_timing()
+        self.call_times: List[float] = []
+
+    def close(self):
+        """Release pooled HTTP connections. Called by the runner after cleanup()."""
+        self.http.close()
 
     def run(self) -> None:
         """
@@ -96,42 +122,78 @@ class ScenarioBase:
 
     def get_devices(self) -> List[Dict[str, Any]]:
         """Get list of all devices from runtime."""
-        devices = api_get_devices(self.base_url, timeout=5)
+        devices = api_get_devices(self.base_url, timeout=self.REQUEST_TIMEOUT_S, session=self.http)
         if devices is None:
             raise RuntimeError("Failed to fetch devices from runtime")
         return devices
 
     def get_capabilities(self, provider: str, device: str) -> Dict[str, Any]:
-        """Get device capabilities (signals and functions)."""
-        return api_get_capabilities(self.base_url, provider, device, timeout=5)
+        """Get device capabilities (signals and functions), fetched once per device for this scenario."""
+        caps = self._capabilities.get((provider, device))
+        if caps is None:
+            caps = api_get_capabilities(
+                self.base_url, provider, device, timeout=self.REQUEST_TIMEOUT_S, session=self.http
+            )
+            self._capabilities[(provider, device)] = caps
+        return caps
 
     def get_state(self, provider: str, device: str) -> Dict[str, Any]:
         """Get normalized device state."""
-        return api_get_state(self.base_url, provider, device, timeout=5)
+        return api_get_state(self.base_url, provider, device, timeout=self.REQUEST_TIMEOUT_S, session=self.http)
 
     def get_all_state(self) -> Dict[str, Any]:
         """Get state of all devices."""
-        return api_get_all_state(self.base_url, timeout=5)
+        return api_get_all_state(self.base_url, timeout=self.REQUEST_TIMEOUT_S, session=self.http)
 
     def call_function(self, provider: str, device: str, function: Any, args: Dict[str, Any]) -> Dict[str, Any]:
-        """Call a device function by id or name."""
-        return call_device_function(self.base_url, provider, device, function, args, timeout=20)
+        """Call a device function by id or name (names resolve through a per-device cache)."""
+        if isinstance(function, str):
+            function = self._function_id(provider, device, function)
+        start = time.perf_counter()
+        try:
+            return call_device_function(
+                self.base_url, provider, device, function, args, timeout=self.CALL_TIMEOUT_S, session=self.http
+            )
+        finally:
+            self.call_times.append(time.perf_counter() - start)
+
+    def call_timing(self) -> Dict[str, float]:
+        """Summarize call_function latency for this scenario (count, p50/p95/max in ms)."""
+        times = sorted(self.call_times)
+        if not times:
+            return {"n": 0}
+        return {
+            "n": len(times),
+            "p50_ms": round(times[len(times) // 2] * 1000, 1),
+            "p95_ms": round(times[min(len(times) - 1, int(len(times) * 0.95))] * 1000, 1),
+            "max_ms": round(times[-1] * 1000, 1),
+        }
+
+    def _function_id(self, provider: str, device: str, name: str) -> int:
+        """Resolve a function name to its id via the cached capabilities."""
+        ids = self._function_ids.get((provider, device))
+        if ids is None:
+            ids = function_ids_by_name(self.get_capabilities(provider, device))
+            self._function_ids[(provider, device)] = ids
+        if name not in ids:
+            raise ValueError(f"Function '{name}' not found in {provider}/{device}. Available: {list(ids)}")
+        return ids[name]
 
     def get_runtime_status(self) -> Dict[str, Any]:
         """Get runtime status."""
-        status = api_get_runtime_status(self.base_url, timeout=5)
+        status = api_get_runtime_status(self.base_url, timeout=self.REQUEST_TIMEOUT_S, session=self.http)
         if status is None:
             raise RuntimeError("Failed to fetch runtime status")
         return status
 
     def set_mode(self, mode: str):
         """Set runtime control mode (MANUAL or AUTO)."""
-        if not api_set_mode(self.base_url, mode, timeout=5):
+        if not api_set_mode(self.base_url, mode, timeout=self.REQUEST_TIMEOUT_S, session=self.http):
             raise RuntimeError(f"Failed to set runtime mode to {mode}")
 
     def wait_for_mode(self, expected_mode: str, timeout: float = 5.0) -> bool:
         """Wait for runtime to reach expected mode."""
-        return api_assert_mode(self.base_url, expected_mode, timeout)
+        return api_assert_mode(self.base_url, expected_mode, timeout, session=self.http)
 
     def assert_device_exists(self, provider: str, device: str):
         """Assert that a device exists."""
@@ -141,14 +203,15 @@ class ScenarioBase:
                 return
         raise AssertionError(f"Device {provider}/{device} not found")
 
+    @staticmethod
+    def signal_values(state: Dict[str, Any]) -> Dict[str, Any]:
+        """Index a normalized state's signals as signal_id -> value for repeated lookups."""
+        return {sig.get("signal_id"): sig.get("value") for sig in state.get("signals", [])}
+
     def assert_signal_exists(self, provider: str, device: str, signal_id: str):
         """Assert that a signal exists on a device."""
-        state = self.get_state(provider, device)
-        signals = state.get("signals", [])
-        for sig in signals:
-            if sig.get("signal_id") == signal_id:
-                return
-        raise AssertionError(f"Signal {signal_id} not found on {provider}/{device}")
+        if signal_id not in self.signal_values(self.get_state(provider, device)):
+            raise AssertionError(f"Signal {signal_id} not found on {provider}/{device}")
 
     def assert_signal_value(
         self,
@@ -162,25 +225,20 @@ class ScenarioBase:
         Assert that a signal has an expected value.
         For floats, uses tolerance for comparison.
         """
-        state = self.get_state(provider, device)
-        signals = state.get("signals", [])
-
-        for sig in signals:
-            if sig.get("signal_id") == signal_id:
-                actual = sig.get("value")
+        values = self.signal_values(self.get_state(provider, device))
+        if signal_id not in values:
+            raise AssertionError(f"Signal {signal_id} not found")
+        actual = values[signal_id]
 
-                # Handle float comparison with tolerance
-                if isinstance(expected_value, float) and isinstance(actual, (int, float)):
-                    assert abs(actual - expected_value) <= tolerance, (
-                        f"Signal {signal_id}: expected {expected_value}, got {actual} (tolerance {tolerance})"
-                    )
-                    return
+        # Handle float comparison with tolerance
+        if isinstance(expected_value, float) and isinstance(actual, (int, float)):
+            assert abs(actual - expected_value) <= tolerance, (
+                f"Signal {signal_id}: expected {expected_value}, got {actual} (tolerance {tolerance})"
+            )
+            return
 
-                # Exact comparison for other types
-                assert actual == expected_value, f"Signal {signal_id}: expected {expected_value}, got {actual}"
-                return
-
-        raise AssertionError(f"Signal {signal_id} not found")
+        # Exact comparison for other types
+        assert actual == expected_value, f"Signal {signal_id}: expected {expected_value}, got {actual}"
 
     def assert_mode(self, expected_mode: str):
         """Assert that runtime is in expected mode."""
@@ -214,25 +272,104 @@ class ScenarioBase:
         """Sleep for specified seconds (for readability in scenarios)."""
         time.sleep(seconds)
 
+    def poll_value(
+        self,
+        probe: Callable[[], Any],
+        predicate: Callable[[Any], bool],
+        timeout: float = 5.0,
+        interval: float = 0.1,
+    ) -> Tuple[bool, Any]:
+        """
+        Poll a probe until its result satisfies predicate, keeping the last result.
+
+        Lets callers assert on the value that satisfied the poll instead of fetching it again.
+
+        Args:
+            probe: Function returning the value to test (e.g. a get_state call)
+            predicate: Function returning True when the probed value is acceptable
+            timeout: Maximum time to wait
+            interval: Maximum polling interval
+
+        Returns:
+            (True, value) once predicate holds, else (False, last successfully probed value or None)
+        """
+        last: Any = None
+
+        def check() -> bool:
+            nonlocal last
+            last = probe()
+            return predicate(last)
+
+        ok = self.poll_until(check, timeout=timeout, interval=interval)
+        return ok, last
+
+    def wait_for_signal_value(
+        self,
+        provider: str,
+        device: str,
+        signal_id: str,
+        expected: Any,
+        timeout: Optional[float] = None,
+    ) -> Tuple[bool, Any]:
+        """
+        Poll a device signal until it shows the expected value after a function call.
+
+        Args:
+            provider: Provider ID
+            device: Device ID
+            signal_id: Signal ID
+            expected: Value to wait for, or a predicate over the signal value (e.g. a float tolerance check)
+            timeout: Propagation budget (default SIGNAL_PROPAGATION_TIMEOUT_S)
+
+        Returns:
+            (True, value) once the signal matches, else (False, last value seen or None)
+        """
+        matches = expected if callable(expected) else (lambda value: value == expected)
+        return self.poll_value(
+            lambda: self.signal_values(self.get_state(provider, device)).get(signal_id),
+            matches,
+            timeout=self.SIGNAL_PROPAGATION_TIMEOUT_S if timeout is None else timeout,
+            interval=self.SIGNAL_POLL_INTERVAL_S,
+        )
+
+    def gather(self, *calls: Callable[[], Any]) -> List[Any]:
+        """
+        Run independent helper calls concurrently over the scenario's session.
+
+        Args:
+            calls: Zero-argument callables, e.g. self.get_devices or lambda: self.get_state(...)
+
+        Returns:
+            Results in the order the calls were given; the first exception raised is re-raised
+        """
+        with ThreadPoolExecutor(max_workers=max(len(calls), 1)) as pool:
+            return list(pool.map(lambda call: call(), calls))
+
     def poll_until(self, condition_func, timeout: float = 5.0, interval: float = 0.1) -> bool:
         """
         Poll until condition function returns True or timeout.
 
+        The delay between checks starts at 10 ms and doubles up to interval.
+
         Args:
             condition_func: Function that returns True when condition met
             timeout: Maximum time to wait
-            interval: Polling interval
+            interval: Maximum polling interval
 
         Returns:
             True if condition met, False if timeout
         """
-        start = time.time()
-        while time.time() - start < timeout:
+        deadline = time.monotonic() + timeout
+        delay = min(0.01, interval)
+        while True:
             try:
                 if condition_func():
                     return True
             except (requests.RequestException, RuntimeError):
                 # Swallow transient network/API errors while polling.
                 pass
-            time.sleep(interval)
-        return False
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, interval)
@@ -56,14 +56,13 @@ class FaultToManualRecovery(ScenarioBase):
 
         # Step 7: Verify device is accessible again.
         # Recovery is asynchronous through provider supervision + state cache polling.
-        recovered = self.poll_until(
-            lambda: len(self.get_state("sim0", "tempctl0").get("signals", [])) > 0,
+        recovered, state = self.poll_value(
+            lambda: self.get_state("sim0", "tempctl0"),
+            lambda s: len(s.get("signals", [])) > 0,
             timeout=5.0,
             interval=0.2,
         )
         assert recovered, "tempctl0 should return signals after recovery"
-
-        state = self.get_state("sim0", "tempctl0")
         assert "signals" in state, "tempctl0 should be accessible after clearing fault"
 
         # Step 8: Perform manual recovery action - call a function to verify control works
@@ -72,10 +71,7 @@ class FaultToManualRecovery(ScenarioBase):
 
         # Step 9: Verify state change took effect.
         relay_updated = self.poll_until(
-            lambda: any(
-                sig.get("signal_id") == "relay1_state" and sig.get("value") is True
-                for sig in self.get_state("sim0", "tempctl0").get("signals", [])
-            ),
+            lambda: self.signal_values(self.get_state("sim0", "tempctl0")).get("relay1_state") is True,
             timeout=3.0,
             interval=0.1,
         )
@@ -15,6 +15,8 @@ This is the baseline "everything works" scenario.
 
 from .base import ScenarioBase
 
+_EXPECTED_DEVICES = frozenset({"tempctl0", "motorctl0", "relayio0", "analogsensor0", "chaos_control"})
+
 
 class HappyPathEndToEnd(ScenarioBase):
     """Validate complete device discovery -> state -> control -> telemetry flow."""
@@ -31,16 +33,9 @@ class HappyPathEndToEnd(ScenarioBase):
         assert len(devices) >= 4, f"Expected at least 4 devices, found {len(devices)}"
 
         # Verify expected devices exist
-        device_ids = [d.get("device_id") for d in devices]
-        expected = [
-            "tempctl0",
-            "motorctl0",
-            "relayio0",
-            "analogsensor0",
-            "chaos_control",
-        ]
-        for expected_device in expected:
-            assert expected_device in device_ids, f"Device {expected_device} not found"
+        device_ids = {d.get("device_id") for d in devices}
+        missing = _EXPECTED_DEVICES - device_ids
+        assert not missing, f"Devices not found: {sorted(missing)}"
 
         # Step 3: Get Capabilities - verify tempctl0 capabilities
         caps = self.get_capabilities("sim0", "tempctl0")
@@ -48,12 +43,12 @@ class HappyPathEndToEnd(ScenarioBase):
         assert "functions" in caps, "Capabilities missing 'functions'"
 
         # Verify expected signals exist
-        signal_ids = [s.get("signal_id") for s in caps["signals"]]
+        signal_ids = {s.get("signal_id") for s in caps["signals"]}
         assert "tc1_temp" in signal_ids, "tc1_temp signal not found"
         assert "relay1_state" in signal_ids, "relay1_state signal not found"
 
         # Verify expected functions exist
-        function_names = [f.get("name") for f in caps["functions"]]
+        function_names = {f.get("name") for f in caps["functions"]}
         assert "set_mode" in function_names, "set_mode function not found"
         assert "set_relay" in function_names, "set_relay function not found"
 
@@ -62,11 +57,7 @@ class HappyPathEndToEnd(ScenarioBase):
         assert "signals" in initial_state, "State missing 'signals'"
 
         # Find initial relay1 state
-        initial_relay1 = None
-        for sig in initial_state["signals"]:
-            if sig.get("signal_id") == "relay1_state":
-                initial_relay1 = sig.get("value")
-                break
+        initial_relay1 = self.signal_values(initial_state).get("relay1_state")
         assert initial_relay1 is not None, "relay1_state not found in initial state"
 
         # Step 5: Call Function - toggle relay1
@@ -81,15 +72,7 @@ class HappyPathEndToEnd(ScenarioBase):
         assert result["status"] == "OK", f"Function call failed: {result}"
 
         # Step 6: Verify State Change
-        self.sleep(0.2)  # Allow state to propagate
-
-        updated_state = self.get_state("sim0", "tempctl0")
-        updated_relay1 = None
-        for sig in updated_state["signals"]:
-            if sig.get("signal_id") == "relay1_state":
-                updated_relay1 = sig.get("value")
-                break
-
+        _, updated_relay1 = self.wait_for_signal_value("sim0", "tempctl0", "relay1_state", new_relay_state)
         assert updated_relay1 == new_relay_state, (
             f"Relay state not updated: expected {new_relay_state}, got {updated_relay1}"
         )
@@ -23,20 +23,22 @@ class ModeSafety(ScenarioBase):
         # Note: Runtime config explicitly sets MANUAL for tests, so we transition to IDLE for this test
         self.set_mode("IDLE")
 
-        # Test 2: Verify read-only operations work in IDLE
-        status = self.get_runtime_status()
+        # Test 2: Verify read-only operations work in IDLE (independent reads, issued concurrently)
+        status, devices, state, caps = self.gather(
+            self.get_runtime_status,
+            self.get_devices,
+            lambda: self.get_state("sim0", "tempctl0"),
+            lambda: self.get_capabilities("sim0", "tempctl0"),
+        )
         assert status["mode"] == "IDLE", "Mode should be IDLE"
 
-        # Get device list (read-only)
-        devices = self.get_devices()
+        # Device list (read-only)
         assert len(devices) >= 4, f"Expected at least 4 devices, found {len(devices)}"
 
-        # Get device state (read-only)
-        state = self.get_state("sim0", "tempctl0")
+        # Device state (read-only)
         assert "signals" in state, "Should be able to read device state in IDLE"
 
-        # Get device capabilities (read-only)
-        caps = self.get_capabilities("sim0", "tempctl0")
+        # Device capabilities (read-only)
         assert "signals" in caps, "Should be able to read capabilities in IDLE"
 
         # Test 3: Verify control operations are blocked in IDLE.
@@ -54,13 +56,7 @@ class ModeSafety(ScenarioBase):
         assert result["status"] == "OK", "Control operation should succeed in MANUAL mode"
 
         # Verify state changed
-        self.sleep(0.2)  # Allow state to propagate
-        state = self.get_state("sim0", "tempctl0")
-        relay1_state = None
-        for sig in state["signals"]:
-            if sig.get("signal_id") == "relay1_state":
-                relay1_state = sig.get("value")
-                break
+        _, relay1_state = self.wait_for_signal_value("sim0", "tempctl0", "relay1_state", True)
         assert relay1_state is True, "Relay should be ON after successful call"
 
         # Clean up: turn relay back off
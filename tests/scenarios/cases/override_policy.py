@@ -31,11 +31,7 @@ class OverridePolicy(ScenarioBase):
 
         # Get initial relay state
         initial_state = self.get_state("sim0", "tempctl0")
-        initial_relay1 = None
-        for sig in initial_state["signals"]:
-            if sig.get("signal_id") == "relay1_state":
-                initial_relay1 = sig.get("value")
-                break
+        initial_relay1 = self.signal_values(initial_state).get("relay1_state")
 
         # Call function to toggle relay
         new_relay_state = not initial_relay1
@@ -50,15 +46,7 @@ class OverridePolicy(ScenarioBase):
         assert result.get("status") == "OK", f"Override call should succeed in AUTO mode: {result.get('message', '')}"
 
         # Step 5: Verify state changed (override was applied)
-        self.sleep(0.2)  # Allow state to propagate
-
-        updated_state = self.get_state("sim0", "tempctl0")
-        updated_relay1 = None
-        for sig in updated_state["signals"]:
-            if sig.get("signal_id") == "relay1_state":
-                updated_relay1 = sig.get("value")
-                break
-
+        _, updated_relay1 = self.wait_for_signal_value("sim0", "tempctl0", "relay1_state", new_relay_state)
         assert updated_relay1 == new_relay_state, (
             f"Relay state not updated by override: expected {new_relay_state}, got {updated_relay1}"
         )
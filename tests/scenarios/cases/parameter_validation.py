@@ -86,14 +86,9 @@ class ParameterValidation(ScenarioBase):
         assert result["status"] == "OK", "Valid setpoint call should succeed"
 
         # Verify setpoint was actually set
-        self.sleep(0.1)
-        state = self.get_state("sim0", "tempctl0")
-        setpoint_signal = None
-        for sig in state["signals"]:
-            if sig.get("signal_id") == "setpoint":
-                setpoint_signal = sig.get("value")
-                break
-
+        _, setpoint_signal = self.wait_for_signal_value(
+            "sim0", "tempctl0", "setpoint", lambda value: value is not None and abs(value - 60.0) < 0.1
+        )
         assert setpoint_signal is not None and abs(setpoint_signal - 60.0) < 0.1, (
             f"Setpoint not updated correctly: expected 60.0, got {setpoint_signal}"
         )
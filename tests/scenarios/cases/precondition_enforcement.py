@@ -23,15 +23,8 @@ class PreconditionEnforcement(ScenarioBase):
         result = self.call_function("sim0", "tempctl0", "set_mode", {"mode": "closed"})
         assert result["status"] == "OK", "Failed to set mode to closed"
 
-        self.sleep(0.1)  # Allow state to update
-
         # Step 1.2: Verify mode is closed
-        state = self.get_state("sim0", "tempctl0")
-        mode_signal = None
-        for sig in state["signals"]:
-            if sig.get("signal_id") == "control_mode":
-                mode_signal = sig.get("value")
-                break
+        _, mode_signal = self.wait_for_signal_value("sim0", "tempctl0", "control_mode", "closed")
         assert mode_signal == "closed", "Mode not set to closed"
 
         # Step 1.3: Attempt to call set_relay - should fail precondition
@@ -46,7 +39,9 @@ class PreconditionEnforcement(ScenarioBase):
         result = self.call_function("sim0", "tempctl0", "set_mode", {"mode": "open"})
         assert result["status"] == "OK", "Failed to set mode back to open"
 
-        self.sleep(0.1)
+        # Verify mode is open before relying on it
+        _, mode_signal = self.wait_for_signal_value("sim0", "tempctl0", "control_mode", "open")
+        assert mode_signal == "open", f"Mode not set back to open, got {mode_signal}"
 
         # Step 1.5: Now set_relay should succeed
         result = self.call_function("sim0", "tempctl0", "set_relay", {"relay_index": 1, "state": False})
@@ -54,20 +49,16 @@ class PreconditionEnforcement(ScenarioBase):
 
         # Test 2: analogsensor0 - calibrate_channel blocked when quality != "GOOD"
         def quality_value() -> str | None:
-            state = self.get_state("sim0", "analogsensor0")
-            for sig in state["signals"]:
-                if sig.get("signal_id") == "sensor_quality":
-                    value = sig.get("value")
-                    return value if isinstance(value, str) else None
-            return None
+            value = self.signal_values(self.get_state("sim0", "analogsensor0")).get("sensor_quality")
+            return value if isinstance(value, str) else None
 
         # Establish known baseline quality.
         result = self.call_function("sim0", "analogsensor0", "inject_noise", {"enabled": False})
         assert result["status"] == "OK", "Failed to disable noise before calibration checks"
 
         try:
-            good_ready = self.poll_until(lambda: quality_value() == "GOOD", timeout=5.0, interval=0.2)
-            assert good_ready, f"Expected sensor_quality to settle at GOOD, got {quality_value()}"
+            good_ready, quality = self.poll_value(quality_value, lambda q: q == "GOOD", timeout=5.0, interval=0.2)
+            assert good_ready, f"Expected sensor_quality to settle at GOOD, got {quality}"
 
             # Quality GOOD -> calibration allowed.
             result = self.call_function("sim0", "analogsensor0", "calibrate_channel", {"channel": 1})
@@ -77,17 +68,18 @@ class PreconditionEnforcement(ScenarioBase):
             result = self.call_function("sim0", "analogsensor0", "inject_noise", {"enabled": True})
             assert result["status"] == "OK", "Failed to enable noise injection"
 
-            degraded_ready = self.poll_until(
-                lambda: quality_value() in {"NOISY", "FAULT"},
+            degraded_ready, quality = self.poll_value(
+                quality_value,
+                lambda q: q in {"NOISY", "FAULT"},
                 timeout=35.0,
                 interval=0.5,
             )
-            assert degraded_ready, f"Expected sensor_quality to degrade to NOISY/FAULT, got {quality_value()}"
+            assert degraded_ready, f"Expected sensor_quality to degrade to NOISY/FAULT, got {quality}"
 
             # Non-GOOD quality -> calibration blocked.
             result = self.call_function("sim0", "analogsensor0", "calibrate_channel", {"channel": 1})
             assert result.get("status") == "FAILED_PRECONDITION", (
-                f"Expected FAILED_PRECONDITION when quality={quality_value()}, got {result.get('status')}"
+                f"Expected FAILED_PRECONDITION when quality={quality}, got {result.get('status')}"
             )
         finally:
             cleanup = self.call_function("sim0", "analogsensor0", "inject_noise", {"enabled": False})
@@ -105,15 +105,7 @@ class ProviderRestartRecovery(ScenarioBase):
         assert result["status"] == "OK", "Function calls should work after provider recovery"
 
         # Step 10: Verify state change took effect
-        self.sleep(0.2)
-
-        state = self.get_state("sim0", "tempctl0")
-        relay1_state = None
-        for sig in state["signals"]:
-            if sig.get("signal_id") == "relay1_state":
-                relay1_state = sig.get("value")
-                break
-
+        _, relay1_state = self.wait_for_signal_value("sim0", "tempctl0", "relay1_state", True)
         assert relay1_state is True, "State changes should work after provider recovery"
 
         # Step 11: Verify all device list is complete
@@ -63,9 +63,9 @@ class SlowSseClientBehavior(ScenarioBase):
             self.sleep(1.0)  # Give the SSE subscription time to establish.
 
             # Step 1: Verify baseline responsiveness
-            start = time.time()
+            start = time.monotonic()
             self.get_runtime_status()
-            baseline_latency = time.time() - start
+            baseline_latency = time.monotonic() - start
 
             assert baseline_latency < 3.0, f"Baseline latency too high: {baseline_latency}s"
 
@@ -74,7 +74,7 @@ class SlowSseClientBehavior(ScenarioBase):
             latencies = []
 
             for i in range(operation_count):
-                start = time.time()
+                start = time.monotonic()
 
                 # Mix of requests while SSE consumer is intentionally slow.
                 if i % 3 == 0:
@@ -84,7 +84,7 @@ class SlowSseClientBehavior(ScenarioBase):
                 else:
                     self.get_state("sim0", "motorctl0")
 
-                latency = time.time() - start
+                latency = time.monotonic() - start
                 latencies.append(latency)
 
                 # Small delay to avoid overwhelming
@@ -98,9 +98,9 @@ class SlowSseClientBehavior(ScenarioBase):
             assert max_latency < 5.0, f"Max latency too high: {max_latency}s"
 
             # Step 4: Trigger a state change and verify runtime remains responsive.
-            start = time.time()
+            start = time.monotonic()
             result = self.call_function("sim0", "relayio0", "set_relay_ch1", {"enabled": True})
-            call_latency = time.time() - start
+            call_latency = time.monotonic() - start
 
             assert result["status"] == "OK", "Function call should succeed under load"
             assert call_latency < 5.0, f"Function call latency too high: {call_latency}s"
@@ -142,9 +142,9 @@ class SlowSseClientBehavior(ScenarioBase):
             assert len(results) == len(devices), f"Not all concurrent requests completed: {len(results)}/{len(devices)}"
 
             # Step 7: Verify runtime is still responsive after load
-            start = time.time()
+            start = time.monotonic()
             self.get_runtime_status()
-            final_latency = time.time() - start
+            final_latency = time.monotonic() - start
 
             assert final_latency < 3.0, f"Post-load latency too high: {final_latency}s"
         finally:
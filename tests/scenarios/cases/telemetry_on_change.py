@@ -72,24 +72,13 @@ class TelemetryOnChange(ScenarioBase):
 
             # Step 1: Get initial state.
             initial_state = self.get_state("sim0", "relayio0")
-            initial_ch1 = None
-            for sig in initial_state["signals"]:
-                if sig.get("signal_id") == "relay_ch1_state":
-                    initial_ch1 = sig.get("value")
-                    break
-
+            initial_ch1 = self.signal_values(initial_state).get("relay_ch1_state")
             assert initial_ch1 is not None, "relay_ch1_state not found"
 
             # Step 2: Poll state repeatedly without changing values.
             poll_count = 5
             for i in range(poll_count):
-                state = self.get_state("sim0", "relayio0")
-                ch1_value = None
-                for sig in state["signals"]:
-                    if sig.get("signal_id") == "relay_ch1_state":
-                        ch1_value = sig.get("value")
-                        break
-
+                ch1_value = self.signal_values(self.get_state("sim0", "relayio0")).get("relay_ch1_state")
                 assert ch1_value == initial_ch1, f"Signal value changed unexpectedly on poll {i + 1}"
 
                 self.sleep(0.1)
@@ -109,14 +98,7 @@ class TelemetryOnChange(ScenarioBase):
             assert result["status"] == "OK", "Failed to change relay state"
 
             # Step 4: Verify state change is reflected in state API.
-            self.sleep(0.2)
-            changed_state = self.get_state("sim0", "relayio0")
-            changed_ch1 = None
-            for sig in changed_state["signals"]:
-                if sig.get("signal_id") == "relay_ch1_state":
-                    changed_ch1 = sig.get("value")
-                    break
-
+            _, changed_ch1 = self.wait_for_signal_value("sim0", "relayio0", "relay_ch1_state", new_ch1_state)
             assert changed_ch1 == new_ch1_state, (
                 f"State change not reflected: expected {new_ch1_state}, got {changed_ch1}"
             )
@@ -140,13 +122,7 @@ class TelemetryOnChange(ScenarioBase):
             with events_lock:
                 pre_postchange_count = len(telemetry_events)
             for i in range(3):
-                state = self.get_state("sim0", "relayio0")
-                ch1_value = None
-                for sig in state["signals"]:
-                    if sig.get("signal_id") == "relay_ch1_state":
-                        ch1_value = sig.get("value")
-                        break
-
+                ch1_value = self.signal_values(self.get_state("sim0", "relayio0")).get("relay_ch1_state")
                 assert ch1_value == new_ch1_state, f"Signal value inconsistent on post-change poll {i + 1}"
                 self.sleep(0.1)
 
@@ -44,7 +44,7 @@ def _scenario_config(provider_exe: Path, port: int, policy: str) -> dict:
     }
 
 
-def _run_case(case_cls, runtime_factory, provider_exe: Path, unique_port: int):
+def _run_case(case_cls, runtime_factory, provider_exe: Path, unique_port: int, record_property):
     policy = "OVERRIDE" if case_cls is OverridePolicy else "BLOCK"
     fixture = runtime_factory(config_dict=_scenario_config(provider_exe, unique_port, policy), port=unique_port)
     scenario = case_cls(fixture.base_url)
@@ -57,6 +57,9 @@ def _run_case(case_cls, runtime_factory, provider_exe: Path, unique_port: int):
             scenario.cleanup()
         except Exception:
             pass
+        scenario.close()
+        # Surfaces in --junitxml output; lets slow runs be attributed to device calls vs. polling
+        record_property("call_timing", scenario.call_timing())
 
 
 @pytest.mark.integration
@@ -75,16 +78,16 @@ def _run_case(case_cls, runtime_factory, provider_exe: Path, unique_port: int):
         ModeSafety,
     ],
 )
-def test_scenario_cases(case_cls, runtime_factory, provider_exe: Path, unique_port: int):
-    _run_case(case_cls, runtime_factory, provider_exe, unique_port)
+def test_scenario_cases(case_cls, runtime_factory, provider_exe: Path, unique_port: int, record_property):
+    _run_case(case_cls, runtime_factory, provider_exe, unique_port, record_property)
 
 
 @pytest.mark.integration
 @pytest.mark.scenario
 @pytest.mark.slow
 @pytest.mark.timeout(600)
-def test_provider_restart_recovery(runtime_factory, provider_exe: Path, unique_port: int):
-    _run_case(ProviderRestartRecovery, runtime_factory, provider_exe, unique_port)
+def test_provider_restart_recovery(runtime_factory, provider_exe: Path, unique_port: int, record_property):
+    _run_case(ProviderRestartRecovery, runtime_factory, provider_exe, unique_port, record_property)
 
 
 @pytest.mark.integration
@@ -93,5 +96,5 @@ def test_provider_restart_recovery(runtime_factory, provider_exe: Path, unique_p
 @pytest.mark.slow
 @pytest.mark.timeout(900)
 @pytest.mark.parametrize("case_cls", [MultiDeviceConcurrency, SlowSseClientBehavior])
-def test_stress_scenarios(case_cls, runtime_factory, provider_exe: Path, unique_port: int):
-    _run_case(case_cls, runtime_factory, provider_exe, unique_port)
+def test_stress_scenarios(case_cls, runtime_factory, provider_exe: Path, unique_port: int, record_property):
+    _run_case(case_cls, runtime_factory, provider_exe, unique_port, record_property)
@@ -11,13 +11,72 @@ Philosophy:
 - Tests should be resilient to log format changes
 """
 
+import json
+import socket
+import threading
 import time
-from typing import Any, Callable, Dict, List, Optional, cast
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, cast
 
 import requests
 
+try:
+    import orjson
 
-def get_provider_health_entry(base_url: str, provider_id: str, timeout: float = 5.0) -> Optional[Dict[str, Any]]:
+    _json_loads: Callable[[bytes], Any] = orjson.loads
+except ImportError:  # pragma: no cover - orjson is an optional accelerator
+    _json_loads = json.loads
+
+
+def decode_json(resp: requests.Response) -> Any:
+    """
+    Decode a JSON response body, using orjson when it is installed.
+
+    Parses the raw bytes directly, skipping Response.json()'s charset detection and text decode.
+    Malformed bodies raise requests.exceptions.JSONDecodeError as with Response.json(), so callers
+    that retry on requests.RequestException keep treating a bad body as transient.
+
+    Args:
+        resp: Response whose body is JSON
+
+    Returns:
+        Decoded JSON value
+
+    Raises:
+        requests.exceptions.JSONDecodeError: If the body is not valid JSON
+    """
+    try:
+        return _json_loads(resp.content)
+    except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses it
+        raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
+
+
+def _health_providers(resp: requests.Response) -> List[Any]:
+    """Decode the providers list of a /v0/providers/health response (hot polling path)."""
+    return cast(List[Any], decode_json(resp).get("providers", []))
+
+
+def _http_get(url: str, timeout: float, session: Optional[requests.Session] = None, **kwargs: Any) -> requests.Response:
+    """GET through a caller-owned keep-alive session when given, else a one-shot connection."""
+    if session is not None:
+        return session.get(url, timeout=timeout, **kwargs)
+    return requests.get(url, timeout=timeout, **kwargs)
+
+
+def _http_post(
+    url: str, timeout: float, session: Optional[requests.Session] = None, **kwargs: Any
+) -> requests.Response:
+    """POST counterpart of _http_get."""
+    if session is not None:
+        return session.post(url, timeout=timeout, **kwargs)
+    return requests.post(url, timeout=timeout, **kwargs)
+
+
+def get_provider_health_entry(
+    base_url: str,
+    provider_id: str,
+    timeout: float = 5.0,
+    session: Optional[requests.Session] = None,
+) -> Optional[Dict[str, Any]]:
     """
     Fetch the full provider health entry from /v0/providers/health.
 
@@ -25,15 +84,16 @@ def get_provider_health_entry(base_url: str, provider_id: str, timeout: float =
         base_url: Base URL of runtime HTTP server
         provider_id: Provider ID to look up
         timeout: Request timeout in seconds
+        session: Optional requests.Session to reuse a keep-alive connection across polls
 
     Returns:
         Full provider health dict (containing state, supervision, devices, etc.)
         or None if the request fails or provider not found.
     """
     try:
-        resp = requests.get(f"{base_url}/v0/providers/health", timeout=timeout)
+        resp = _http_get(f"{base_url}/v0/providers/health", timeout, session)
         resp.raise_for_status()
-        for entry in resp.json().get("providers", []):
+        for entry in _health_providers(resp):
             if entry.get("provider_id") == provider_id:
                 return cast(Dict[str, Any], entry)
     except (requests.exceptions.RequestException, ValueError, KeyError):
@@ -41,6 +101,47 @@ def get_provider_health_entry(base_url: str, provider_id: str, timeout: float =
     return None
 
 
+def get_provider_health_entry_conditional(
+    base_url: str,
+    provider_id: str,
+    etag: Optional[str] = None,
+    cached_entry: Optional[Dict[str, Any]] = None,
+    timeout: float = 5.0,
+    session: Optional[requests.Session] = None,
+) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    """
+    Fetch a provider health entry, revalidating a cached one via the endpoint's ETag.
+
+    While supervision state is unchanged the runtime answers 304 and the cached entry is
+    reused without re-parsing. Timing fields (uptime_seconds, next_restart_in_ms values)
+    in a reused entry are therefore as of the last full response.
+
+    Args:
+        base_url: Base URL of runtime HTTP server
+        provider_id: Provider ID to look up
+        etag: ETag from the previous call (None forces a full fetch)
+        cached_entry: Entry returned by the previous call
+        timeout: Request timeout in seconds
+        session: Optional requests.Session to reuse a keep-alive connection across polls
+
+    Returns:
+        (etag, entry) to pass to the next call; entry is None if the request fails or
+        the provider is not found.
+    """
+    headers = {"If-None-Match": etag} if etag is not None and cached_entry is not None else {}
+    try:
+        resp = _http_get(f"{base_url}/v0/providers/health", timeout, session, headers=headers)
+        if resp.status_code == 304:
+            return etag, cached_entry
+        resp.raise_for_status()
+        for entry in _health_providers(resp):
+            if entry.get("provider_id") == provider_id:
+                return resp.headers.get("ETag"), cast(Dict[str, Any], entry)
+    except (requests.exceptions.RequestException, ValueError, KeyError):
+        pass
+    return None, None
+
+
 def get_provider_supervision(base_url: str, provider_id: str, timeout: float = 5.0) -> Optional[Dict[str, Any]]:
     """
     Fetch just the supervision block for a provider from /v0/providers/health.
@@ -60,6 +161,144 @@ def get_provider_supervision(base_url: str, provider_id: str, timeout: float = 5
     return None
 
 
+# Name prefix of the stream_provider_health() event watcher thread (suffixed with the provider ID).
+HEALTH_WATCHER_THREAD_PREFIX = "provider-health-watch-"
+
+
+def _health_signature(entry: Optional[Dict[str, Any]]) -> Tuple[Any, ...]:
+    """Fields whose change marks a supervision transition edge."""
+    if entry is None:
+        return (None, None, None)
+    supervision = entry.get("supervision") or {}
+    return (entry.get("state"), supervision.get("attempt_count"), supervision.get("circuit_open"))
+
+
+def _close_stream(resp: requests.Response) -> None:
+    """
+    Close a streaming response, unblocking a thread parked in resp.iter_lines().
+
+    Response.close() alone waits on the reader's buffer lock until the next chunk arrives
+    (up to the 15s SSE keep-alive), so the socket is shut down first to wake the reader.
+    """
+    # urllib3 2.x keeps the pooled connection on a streaming response until it is released
+    connection = resp.raw.connection
+    sock = connection.sock if connection is not None else None
+    if isinstance(sock, socket.socket):
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+    resp.close()
+
+
+def stream_provider_health(
+    base_url: str,
+    provider_id: str,
+    deadline: float,
+    idle_interval: float = 0.25,
+    min_interval: float = 0.01,
+    max_interval: float = 0.2,
+    growth: float = 1.3,
+    session: Optional[requests.Session] = None,
+) -> Generator[Optional[Dict[str, Any]], None, None]:
+    """
+    Yield provider health entries as supervision state changes, until deadline.
+
+    Subscribes to /v0/events (filtered by provider_id) and re-samples /v0/providers/health
+    whenever a provider_health_change event arrives, instead of polling on a fixed tick.
+    Between events (or when the event stream is unavailable, e.g. 404 on a runtime without
+    SSE) samples follow an adaptive schedule: min_interval right after a transition in
+    state/attempt_count/circuit_open, growing by growth per idle sample up to max_interval
+    (idle_interval while the event stream is live). Detection stays tight at transition
+    edges while long steady waits cost only a handful of requests.
+
+    Args:
+        base_url: Base URL of runtime HTTP server
+        provider_id: Provider ID to watch
+        deadline: Absolute time.monotonic() value after which the generator stops
+        idle_interval: Interval cap while the event stream is live
+        min_interval: Interval after a transition (and initially)
+        max_interval: Interval cap when polling without the event stream
+        growth: Multiplier applied to the interval after each unchanged sample
+        session: Optional requests.Session reused for the health samples
+
+    Yields:
+        Provider health entry dict (as get_provider_health_entry), or None if unavailable
+
+    Closing the generator (or exhausting it) closes the event stream and joins the watcher.
+    """
+    changed = threading.Event()
+    streaming = threading.Event()
+    settled = threading.Event()
+    stop = threading.Event()
+    stream_lock = threading.Lock()
+    streams: List[requests.Response] = []
+
+    def watch() -> None:
+        try:
+            with requests.get(
+                f"{base_url}/v0/events",
+                params={"provider_id": provider_id},
+                stream=True,
+                timeout=(2.0, 20.0),  # Read timeout above the 15s SSE keep-alive
+                headers={"Accept": "text/event-stream"},
+            ) as resp:
+                with stream_lock:
+                    if stop.is_set():
+                        return
+                    streams.append(resp)
+                if resp.status_code != 200 or "text/event-stream" not in resp.headers.get("Content-Type", ""):
+                    return
+                streaming.set()
+                settled.set()
+                for line in resp.iter_lines(decode_unicode=True):
+                    if stop.is_set():
+                        return
+                    if line == "event: provider_health_change":
+                        changed.set()
+        except requests.exceptions.RequestException:
+            pass
+        finally:
+            streaming.clear()
+            settled.set()
+
+    watcher = threading.Thread(target=watch, name=f"{HEALTH_WATCHER_THREAD_PREFIX}{provider_id}", daemon=True)
+    watcher.start()
+    # Subscribe before the first sample so no transition falls between them.
+    settled.wait(timeout=max(0.0, min(2.0, deadline - time.monotonic())))
+
+    etag: Optional[str] = None
+    entry: Optional[Dict[str, Any]] = None
+    prev_signature: Optional[Tuple[Any, ...]] = None
+    interval = min_interval
+    try:
+        while True:
+            changed.clear()
+            etag, entry = get_provider_health_entry_conditional(
+                base_url, provider_id, etag, entry, timeout=1.0, session=session
+            )
+            yield entry
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+
+            signature = _health_signature(entry)
+            cap = idle_interval if streaming.is_set() else max_interval
+            if signature != prev_signature:
+                interval = min_interval
+            else:
+                interval = min(interval * growth, cap)
+            prev_signature = signature
+            changed.wait(timeout=min(interval, remaining))
+    finally:
+        # Release the SSE subscription now rather than at the next event or keep-alive.
+        with stream_lock:
+            stop.set()
+            for resp in streams:
+                _close_stream(resp)
+        watcher.join(timeout=1.0)
+
+
 def wait_for_supervision_state(
     base_url: str,
     provider_id: str,
@@ -103,38 +342,57 @@ def wait_for_condition(
     timeout: float = 5.0,
     interval: float = 0.1,
     description: str = "condition",
+    min_interval: float = 0.01,
+    growth: float = 1.5,
 ) -> bool:
     """
     Poll a condition function until it returns True or timeout expires.
 
+    The delay between checks starts at min_interval and grows by growth up to interval,
+    so conditions that settle quickly are seen within a check or two while long waits
+    still poll at the caller's interval.
+
     Args:
         condition_func: Function that returns True when condition is met
         timeout: Maximum time to wait in seconds
-        interval: Time between checks in seconds
+        interval: Maximum time between checks in seconds
         description: Human-readable description for error messages
+        min_interval: Delay after the first check in seconds
+        growth: Multiplier applied to the delay after each failed check
 
     Returns:
         True if condition met before timeout, False otherwise
     """
-    deadline = time.time() + timeout
-    while time.time() < deadline:
+    deadline = time.monotonic() + timeout
+    delay = min(min_interval, interval)
+    while True:
         try:
             if condition_func():
                 return True
         except (requests.exceptions.RequestException, ValueError, KeyError):
             # Swallow transient HTTP/parsing errors; let programming errors propagate.
             pass
-        time.sleep(interval)
-    return False
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * growth, interval)
 
 
-def assert_http_available(base_url: str, timeout: float = 10.0) -> bool:
+def assert_http_available(
+    base_url: str,
+    timeout: float = 10.0,
+    session: Optional[requests.Session] = None,
+    interval: float = 0.2,
+) -> bool:
     """
     Wait for HTTP server to become available.
 
     Args:
         base_url: Base URL of runtime HTTP server (e.g., "http://127.0.0.1:8080")
         timeout: Maximum time to wait in seconds
+        session: Optional requests.Session to reuse a keep-alive connection across polls
+        interval: Time between checks in seconds
 
     Returns:
         True if HTTP server responds, False if timeout
@@ -142,15 +400,21 @@ def assert_http_available(base_url: str, timeout: float = 10.0) -> bool:
 
     def check_http():
         try:
-            resp = requests.get(f"{base_url}/v0/runtime/status", timeout=1)
+            resp = _http_get(f"{base_url}/v0/runtime/status", 1, session)
             return resp.status_code == 200
         except requests.exceptions.RequestException:
             return False
 
-    return wait_for_condition(check_http, timeout=timeout, interval=0.2, description="HTTP server available")
+    return wait_for_condition(check_http, timeout=timeout, interval=interval, description="HTTP server available")
 
 
-def assert_provider_available(base_url: str, provider_id: str, timeout: float = 15.0) -> bool:
+def assert_provider_available(
+    base_url: str,
+    provider_id: str,
+    timeout: float = 15.0,
+    session: Optional[requests.Session] = None,
+    interval: float = 0.5,
+) -> bool:
     """
     Wait for provider to be started and available in runtime status.
 
@@ -158,6 +422,8 @@ def assert_provider_available(base_url: str, provider_id: str, timeout: float =
         base_url: Base URL of runtime HTTP server
         provider_id: Provider ID to check (e.g., "sim0")
         timeout: Maximum time to wait in seconds
+        session: Optional requests.Session to reuse a keep-alive connection across polls
+        interval: Time between checks in seconds
 
     Returns:
         True if provider available, False if timeout
@@ -165,10 +431,10 @@ def assert_provider_available(base_url: str, provider_id: str, timeout: float =
 
     def check_provider():
         try:
-            resp = requests.get(f"{base_url}/v0/runtime/status", timeout=2)
+            resp = _http_get(f"{base_url}/v0/runtime/status", 2, session)
             if resp.status_code != 200:
                 return False
-            status = resp.json()
+            status = decode_json(resp)
             providers = status.get("providers", [])
             for p in providers:
                 if p.get("provider_id") == provider_id and p.get("state") == "AVAILABLE":
@@ -180,7 +446,7 @@ def assert_provider_available(base_url: str, provider_id: str, timeout: float =
     return wait_for_condition(
         check_provider,
         timeout=timeout,
-        interval=0.5,
+        interval=interval,
         description=f"provider '{provider_id}' available",
     )
 
@@ -286,7 +552,9 @@ def assert_signal_value(
     )
 
 
-def assert_mode(base_url: str, expected_mode: str, timeout: float = 5.0) -> bool:
+def assert_mode(
+    base_url: str, expected_mode: str, timeout: float = 5.0, session: Optional[requests.Session] = None
+) -> bool:
     """
     Wait for runtime mode to reach expected value.
 
@@ -294,6 +562,7 @@ def assert_mode(base_url: str, expected_mode: str, timeout: float = 5.0) -> bool
         base_url: Base URL of runtime HTTP server
         expected_mode: Expected mode string (MANUAL, AUTO, IDLE, FAULT)
         timeout: Maximum time to wait in seconds
+        session: Optional requests.Session to reuse a keep-alive connection
 
     Returns:
         True if mode matches, False if timeout
@@ -301,10 +570,10 @@ def assert_mode(base_url: str, expected_mode: str, timeout: float = 5.0) -> bool
 
     def check_mode():
         try:
-            resp = requests.get(f"{base_url}/v0/mode", timeout=2)
+            resp = _http_get(f"{base_url}/v0/mode", 2, session)
             if resp.status_code != 200:
                 return False
-            mode_data = resp.json()
+            mode_data = decode_json(resp)
             return mode_data.get("mode") == expected_mode
         except (requests.exceptions.RequestException, ValueError):
             return False
@@ -312,41 +581,47 @@ def assert_mode(base_url: str, expected_mode: str, timeout: float = 5.0) -> bool
     return wait_for_condition(check_mode, timeout=timeout, interval=0.1, description=f"mode == {expected_mode}")
 
 
-def get_runtime_status(base_url: str, timeout: float = 2.0) -> Optional[Dict[str, Any]]:
+def get_runtime_status(
+    base_url: str, timeout: float = 2.0, session: Optional[requests.Session] = None
+) -> Optional[Dict[str, Any]]:
     """
     Get current runtime status.
 
     Args:
         base_url: Base URL of runtime HTTP server
         timeout: Request timeout in seconds
+        session: Optional requests.Session to reuse a keep-alive connection
 
     Returns:
         Status dict or None if request fails
     """
     try:
-        resp = requests.get(f"{base_url}/v0/runtime/status", timeout=timeout)
+        resp = _http_get(f"{base_url}/v0/runtime/status", timeout, session)
         if resp.status_code == 200:
-            return cast(Dict[str, Any], resp.json())
+            return cast(Dict[str, Any], decode_json(resp))
     except (requests.exceptions.RequestException, ValueError):
         pass
     return None
 
 
-def get_devices(base_url: str, timeout: float = 2.0) -> Optional[List[Dict[str, Any]]]:
+def get_devices(
+    base_url: str, timeout: float = 2.0, session: Optional[requests.Session] = None
+) -> Optional[List[Dict[str, Any]]]:
     """
     Get list of registered devices.
 
     Args:
         base_url: Base URL of runtime HTTP server
         timeout: Request timeout in seconds
+        session: Optional requests.Session to reuse a keep-alive connection
 
     Returns:
         List of device dicts or None if request fails
     """
     try:
-        resp = requests.get(f"{base_url}/v0/devices", timeout=timeout)
+        resp = _http_get(f"{base_url}/v0/devices", timeout, session)
         if resp.status_code == 200:
-            data = resp.json()
+            data = decode_json(resp)
             # API returns {"status": {...}, "devices": [...]}
             return cast(List[Dict[str, Any]], data.get("devices", []))
     except (requests.exceptions.RequestException, ValueError):
@@ -354,13 +629,14 @@ def get_devices(base_url: str, timeout: float = 2.0) -> Optional[List[Dict[str,
     return None
 
 
-def get_all_state(base_url: str, timeout: float = 5.0) -> Dict[str, Any]:
+def get_all_state(base_url: str, timeout: float = 5.0, session: Optional[requests.Session] = None) -> Dict[str, Any]:
     """
     Get full state snapshot from /v0/state.
 
     Args:
         base_url: Base URL of runtime HTTP server
         timeout: Request timeout in seconds
+        session: Optional requests.Session to reuse a keep-alive connection
 
     Returns:
         Decoded response body
@@ -369,9 +645,9 @@ def get_all_state(base_url: str, timeout: float = 5.0) -> Dict[str, Any]:
         requests.HTTPError: if response status is not successful
         ValueError: if body is not valid JSON
     """
-    resp = requests.get(f"{base_url}/v0/state", timeout=timeout)
+    resp = _http_get(f"{base_url}/v0/state", timeout, session)
     resp.raise_for_status()
-    return cast(Dict[str, Any], resp.json())
+    return cast(Dict[str, Any], decode_json(resp))
 
 
 def get_device_state(base_url: str, provider_id: str, device_id: str, timeout: float = 2.0) -> Optional[Dict[str, Any]]:
@@ -417,7 +693,7 @@ def get_mode(base_url: str, timeout: float = 2.0) -> Optional[str]:
     return None
 
 
-def set_mode(base_url: str, mode: str, timeout: float = 2.0) -> bool:
+def set_mode(base_url: str, mode: str, timeout: float = 2.0, session: Optional[requests.Session] = None) -> bool:
     """
     Set runtime mode.
 
@@ -425,60 +701,58 @@ def set_mode(base_url: str, mode: str, timeout: float = 2.0) -> bool:
         base_url: Base URL of runtime HTTP server
         mode: Target mode (MANUAL/AUTO/IDLE/FAULT)
         timeout: Request timeout in seconds
+        session: Optional requests.Session to reuse a keep-alive connection
 
     Returns:
         True if mode set successfully, False otherwise
     """
     try:
-        resp = requests.post(
+        resp = _http_post(
             f"{base_url}/v0/mode",
+            timeout,
+            session,
             json={"mode": mode},
             headers={"Content-Type": "application/json"},
-            timeout=timeout,
         )
         return resp.status_code == 200
     except requests.exceptions.RequestException:
         return False
 
 
+# ADPP scalar types; each typed-value object carries its payload under the key named by its type.
+_SCALAR_VALUE_TYPES = frozenset(("double", "int64", "uint64", "bool", "string"))
+
+
 def parse_typed_value(value_obj: Dict[str, Any]) -> Any:
     """Convert ADPP typed-value object to a plain Python value."""
     value_type = value_obj.get("type", "")
-    if value_type == "double":
-        return value_obj.get("double")
-    if value_type == "int64":
-        return value_obj.get("int64")
-    if value_type == "uint64":
-        return value_obj.get("uint64")
-    if value_type == "bool":
-        return value_obj.get("bool")
-    if value_type == "string":
-        return value_obj.get("string")
+    if value_type in _SCALAR_VALUE_TYPES:
+        return value_obj.get(value_type)
     return value_obj
 
 
+def _normalize_signal(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten one `values` entry of a state response into a scenario signal dict."""
+    return {
+        "signal_id": raw.get("signal_id"),
+        "quality": raw.get("quality"),
+        "age_ms": raw.get("age_ms"),
+        "timestamp_epoch_ms": raw.get("timestamp_epoch_ms"),
+        "value": parse_typed_value(cast(Dict[str, Any], raw.get("value", {}))),
+    }
+
+
 def normalize_device_state(data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Normalize /v0/state/{provider}/{device} response to scenario-friendly shape.
 
     Input shape uses `values` with typed objects; output uses `signals` with plain values.
     """
-    signals: List[Dict[str, Any]] = []
-    for raw in data.get("values", []):
-        signal = {
-            "signal_id": raw.get("signal_id"),
-            "quality": raw.get("quality"),
-            "age_ms": raw.get("age_ms"),
-            "timestamp_epoch_ms": raw.get("timestamp_epoch_ms"),
-            "value": parse_typed_value(cast(Dict[str, Any], raw.get("value", {}))),
-        }
-        signals.append(signal)
-
     return {
         "provider_id": data.get("provider_id"),
         "device_id": data.get("device_id"),
         "quality": data.get("quality"),
-        "signals": signals,
+        "signals": [_normalize_signal(raw) for raw in data.get("values", ())],
     }
 
 
@@ -487,27 +761,60 @@ def get_capabilities(
     provider_id: str,
     device_id: str,
     timeout: float = 5.0,
+    session: Optional[requests.Session] = None,
 ) -> Dict[str, Any]:
     """Get device capabilities block from runtime."""
-    resp = requests.get(f"{base_url}/v0/devices/{provider_id}/{device_id}/capabilities", timeout=timeout)
+    resp = _http_get(f"{base_url}/v0/devices/{provider_id}/{device_id}/capabilities", timeout, session)
     resp.raise_for_status()
-    data = cast(Dict[str, Any], resp.json())
+    data = cast(Dict[str, Any], decode_json(resp))
     return cast(Dict[str, Any], data.get("capabilities", data))
 
 
+def function_ids_by_name(capabilities: Dict[str, Any]) -> Dict[str, int]:
+    """
+    Index a device's functions by name.
+
+    Args:
+        capabilities: Capabilities block as returned by get_capabilities()
+
+    Returns:
+        Dict mapping function name to function_id
+    """
+    functions = cast(List[Dict[str, Any]], capabilities.get("functions", []))
+    return cast(Dict[str, int], {f.get("name"): f.get("function_id") for f in functions})
+
+
 def get_state(
     base_url: str,
     provider_id: str,
     device_id: str,
     timeout: float = 5.0,
+    session: Optional[requests.Session] = None,
 ) -> Dict[str, Any]:
     """Get normalized state for one device."""
-    resp = requests.get(f"{base_url}/v0/state/{provider_id}/{device_id}", timeout=timeout)
+    resp = _http_get(f"{base_url}/v0/state/{provider_id}/{device_id}", timeout, session)
     resp.raise_for_status()
-    data = cast(Dict[str, Any], resp.json())
+    data = cast(Dict[str, Any], decode_json(resp))
     return normalize_device_state(data)
 
 
+# Python scalar type -> ADPP type tag. bool precedes int so the isinstance fallback never tags True as int64.
+_ARG_TYPE_TAGS: Dict[type, str] = {bool: "bool", int: "int64", float: "double", str: "string"}
+
+
+def _typed_arg(key: str, value: Any) -> Dict[str, Any]:
+    """Wrap a plain argument value as an ADPP typed value; pre-typed dicts pass through."""
+    tag = _ARG_TYPE_TAGS.get(type(value))
+    if tag is None:
+        if isinstance(value, dict) and "type" in value:
+            return cast(Dict[str, Any], value)
+        # Subclasses (e.g. IntEnum) take the tag of their first matching base.
+        tag = next((t for cls, t in _ARG_TYPE_TAGS.items() if isinstance(value, cls)), None)
+        if tag is None:
+            raise ValueError(f"Unsupported arg type for '{key}': {type(value)}")
+    return {"type": tag, tag: value}
+
+
 def call_device_function(
     base_url: str,
     provider_id: str,
@@ -515,6 +822,7 @@ def call_device_function(
     function: Any,
     args: Dict[str, Any],
     timeout: float = 20.0,
+    session: Optional[requests.Session] = None,
 ) -> Dict[str, Any]:
     """
     Call /v0/call with function specified by id or name.
@@ -522,47 +830,29 @@ def call_device_function(
     Args may be plain python values or pre-typed ADPP objects.
     """
     if isinstance(function, str):
-        caps = get_capabilities(base_url, provider_id, device_id, timeout=timeout)
-        functions_list = caps.get("functions", [])
-        function_id = None
-        for candidate in functions_list:
-            if candidate.get("name") == function:
-                function_id = candidate.get("function_id")
-                break
+        caps = get_capabilities(base_url, provider_id, device_id, timeout=timeout, session=session)
+        function_ids = function_ids_by_name(caps)
+        function_id = function_ids.get(function)
         if function_id is None:
-            available = [candidate.get("name") for candidate in functions_list]
-            raise ValueError(f"Function '{function}' not found in {provider_id}/{device_id}. Available: {available}")
+            raise ValueError(
+                f"Function '{function}' not found in {provider_id}/{device_id}. Available: {list(function_ids)}"
+            )
     else:
         function_id = int(function)
 
-    typed_args: Dict[str, Dict[str, Any]] = {}
-    for key, value in args.items():
-        if isinstance(value, dict) and "type" in value:
-            typed_args[key] = cast(Dict[str, Any], value)
-        elif isinstance(value, bool):
-            typed_args[key] = {"type": "bool", "bool": value}
-        elif isinstance(value, int):
-            typed_args[key] = {"type": "int64", "int64": value}
-        elif isinstance(value, float):
-            typed_args[key] = {"type": "double", "double": value}
-        elif isinstance(value, str):
-            typed_args[key] = {"type": "string", "string": value}
-        else:
-            raise ValueError(f"Unsupported arg type for '{key}': {type(value)}")
-
     payload = {
         "provider_id": provider_id,
         "device_id": device_id,
         "function_id": function_id,
-        "args": typed_args,
+        "args": {key: _typed_arg(key, value) for key, value in args.items()},
     }
-    resp = requests.post(f"{base_url}/v0/call", json=payload, timeout=timeout)
+    resp = _http_post(f"{base_url}/v0/call", timeout, session, json=payload)
 
     # Preserve caller control for 4xx status handling.
     if resp.status_code >= 500:
         resp.raise_for_status()
 
-    data = cast(Dict[str, Any], resp.json())
+    data = cast(Dict[str, Any], decode_json(resp))
     if isinstance(data.get("status"), dict):
         data["status"] = data["status"].get("code", data["status"])
     return data
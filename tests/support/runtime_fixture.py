@@ -8,7 +8,11 @@ Provides RuntimeFixture for safe, scoped process management:
 - Timeout and escalation (SIGTERM -> SIGKILL)
 """
 
+import codecs
+import json
 import os
+import re
+import selectors
 import signal
 import subprocess
 import sys
@@ -17,11 +21,39 @@ import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from queue import Empty, Queue
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
 
 import requests
 
+_DEFAULT_PROVIDER_FIXTURE_CONFIG = str(
+    Path(__file__).parent.parent / "integration" / "fixtures" / "provider-sim-default.yaml"
+).replace("\\", "/")
+
+# Default runtime config; only the HTTP port and provider command vary per fixture.
+_DEFAULT_CONFIG_TEMPLATE = b"""
+runtime: {}
+
+http:
+  enabled: true
+  bind: 127.0.0.1
+  port: %(port)d
+
+providers:
+  - id: sim0
+    command: %(command)s
+    args: ["--config", "%(fixture_config)s"]
+    timeout_ms: 5000
+
+polling:
+  interval_ms: 500
+
+telemetry:
+  enabled: false
+
+logging:
+  level: info
+"""
+
 
 @dataclass
 class ProcessInfo:
@@ -32,24 +64,165 @@ class ProcessInfo:
     process: subprocess.Popen
 
 
+LogRecord = Dict[str, Any]
+T = TypeVar("T")
+
+
+def parse_log_record(line: str) -> Optional[LogRecord]:
+    """
+    Parse one runtime log line emitted with ``logging.format: jsonl``.
+
+    Args:
+        line: Raw output line (provider output and text logs pass through unparsed)
+
+    Returns:
+        Record dict with at least ``level`` and ``msg`` keys, or None if the line is not a JSON log record
+    """
+    if not line.startswith("{"):
+        return None
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(record, dict) or "msg" not in record or "level" not in record:
+        return None
+    return record
+
+
+class _PipeSelector:
+    """
+    Shared reader that multiplexes every capture's stdout pipe through one selector.
+
+    A single daemon thread waits on epoll/kqueue (selectors.DefaultSelector) and reads
+    whichever pipes are ready, so concurrent runtimes share one reader instead of one
+    blocking-readline thread each. Pipes are still drained continuously, so a child can
+    never stall on a full pipe while the test thread is busy with HTTP calls.
+    """
+
+    READ_CHUNK = 65536
+
+    def __init__(self):
+        self._selector = selectors.DefaultSelector()
+        self._lock = threading.Lock()
+        # Self-pipe so register/unregister take effect without waiting out select()
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+        self._selector.register(self._wake_r, selectors.EVENT_READ, None)
+        self._thread = threading.Thread(target=self._run, name="output-capture-selector", daemon=True)
+        self._thread.start()
+
+    def register(self, fd: int, capture: "OutputCapture"):
+        """Start delivering data from fd to capture."""
+        with self._lock:
+            self._selector.register(fd, selectors.EVENT_READ, capture)
+        self._wake()
+
+    def unregister(self, fd: int):
+        """Stop watching fd (no-op if already unregistered at EOF)."""
+        with self._lock:
+            try:
+                self._selector.unregister(fd)
+            except (KeyError, ValueError):
+                pass
+        self._wake()
+
+    def _wake(self):
+        try:
+            os.write(self._wake_w, b"\0")
+        except (BlockingIOError, OSError):
+            pass  # Wake pipe already full; selector will wake anyway
+
+    def _run(self):
+        while True:
+            for key, _ in self._selector.select(timeout=1.0):
+                capture = key.data
+                if capture is None:
+                    try:
+                        os.read(self._wake_r, self.READ_CHUNK)
+                    except (BlockingIOError, OSError):
+                        pass
+                    continue
+
+                try:
+                    data = os.read(key.fd, self.READ_CHUNK)
+                except OSError as e:
+                    capture._add_line(f"[CAPTURE ERROR] {e}")
+                    data = b""
+
+                if data:
+                    capture._feed(data)
+                else:
+                    self.unregister(key.fd)
+                    capture._feed_eof()
+
+
+_pipe_selector: Optional[_PipeSelector] = None
+_pipe_selector_lock = threading.Lock()
+
+
+def _get_pipe_selector() -> _PipeSelector:
+    """Return the process-wide pipe selector, creating it on first use."""
+    global _pipe_selector
+    with _pipe_selector_lock:
+        if _pipe_selector is None:
+            _pipe_selector = _PipeSelector()
+        return _pipe_selector
+
+
 class OutputCapture:
     """Thread-safe output capture with timeout support."""
 
     def __init__(self, process: subprocess.Popen):
         self.process = process
         self.lines: List[str] = []
+        self.records: List[LogRecord] = []
         self.lock = threading.Lock()
-        self.queue: Queue = Queue()
+        # Signalled on every appended line; waiters scan forward from a private cursor
+        self.output_changed = threading.Condition(self.lock)
+        # Pending wait_for_marker() calls; the reader sets the event when a new line contains the marker
+        self._marker_waiters: List[Tuple[str, threading.Event]] = []
         self.stop_event = threading.Event()
         self._thread: Optional[threading.Thread] = None
+        self._fd: Optional[int] = None
+        self._eof = threading.Event()
+        self._partial = ""
+        encoding = getattr(process.stdout, "encoding", None) or "utf-8"
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
 
     def start(self):
-        """Start capturing output in background thread."""
+        """
+        Start capturing output.
+
+        On POSIX the pipe is registered with the shared selector reader; Windows pipes
+        are not selectable, so a per-capture reader thread is used there instead.
+        """
+        stream = self.process.stdout
+        if sys.platform != "win32" and stream is not None:
+            self._fd = stream.fileno()
+            _get_pipe_selector().register(self._fd, self)
+            return
+
         self._thread = threading.Thread(target=self._capture_loop, daemon=True)
         self._thread.start()
 
+    def _feed(self, data: bytes):
+        """Decode a raw chunk from the selector reader and emit complete lines."""
+        self._partial += self._decoder.decode(data)
+        *complete, self._partial = self._partial.split("\n")
+        if complete:
+            self._add_lines([line.rstrip("\r") for line in complete])
+
+    def _feed_eof(self):
+        """Flush any trailing partial line once the pipe reaches EOF."""
+        tail = self._partial + self._decoder.decode(b"", final=True)
+        self._partial = ""
+        if tail:
+            self._add_line(tail.rstrip("\r"))
+        self._eof.set()
+
     def _capture_loop(self):
-        """Background thread that reads merged process output."""
+        """Fallback reader thread for platforms without selectable pipes."""
         try:
             stream = self.process.stdout
             if stream is None:
@@ -71,63 +244,123 @@ class OutputCapture:
             self._add_line(f"[CAPTURE ERROR] {e}")
 
     def _add_line(self, line: str):
-        """Add line to buffer and queue."""
-        with self.lock:
-            self.lines.append(line)
-        self.queue.put(line)
+        """Add a single line to the buffer and wake waiters."""
+        self._add_lines([line])
 
-    def wait_for_marker(self, marker: str, timeout: float = 10.0) -> bool:
-        """Wait for a specific marker to appear in output."""
-        deadline = time.time() + timeout
+    def _add_lines(self, raw_lines: List[str]):
+        """
+        Append a batch of lines and wake waiters once, indexing JSON log records by key.
+
+        Lines are parsed outside the lock; a whole pipe chunk then costs one lock round-trip
+        and one notify instead of one per line.
+        """
+        lines: List[str] = []
+        records: List[LogRecord] = []
+        for line in raw_lines:
+            record = parse_log_record(line)
+            if record is not None:
+                # Keep a text rendering so marker/pattern waits and failure dumps work for both formats
+                line = f"[{record.get('ts', '')}] [{record['level']}] {record['msg']}"
+                records.append(record)
+            lines.append(line)
 
-        # First check existing lines
         with self.lock:
-            for line in self.lines:
-                if marker in line:
-                    return True
+            self.lines.extend(lines)
+            self.records.extend(records)
+            for marker, found in self._marker_waiters:
+                if any(marker in line for line in lines):
+                    found.set()
+            self.output_changed.notify_all()
+
+    def _wait_for_match(self, buffer: List[Any], match: Callable[[Any], Optional[T]], timeout: float) -> Optional[T]:
+        """
+        Scan a capture buffer for the first entry that match() accepts, waiting for new entries.
 
-        # Wait for new lines
-        while time.time() < deadline:
-            try:
-                remaining = deadline - time.time()
+        Each entry is examined exactly once: the cursor only advances, so repeated wakeups
+        scan just the newly appended tail rather than the whole buffer.
+
+        Args:
+            buffer: self.lines or self.records (appended to under self.lock)
+            match: Returns a non-None result for a matching entry
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            First non-None match result, or None on timeout
+        """
+        deadline = time.monotonic() + timeout
+        cursor = 0
+        with self.output_changed:
+            while True:
+                end = len(buffer)
+                while cursor < end:
+                    result = match(buffer[cursor])
+                    cursor += 1
+                    if result is not None:
+                        return result
+                remaining = deadline - time.monotonic()
                 if remaining <= 0:
-                    break
-                line = self.queue.get(timeout=min(remaining, 0.5))
-                if marker in line:
-                    return True
-            except Empty:
-                continue
+                    return None
+                self.output_changed.wait(timeout=remaining)
 
-        return False
+    def wait_for_record(
+        self,
+        predicate: Callable[[LogRecord], bool],
+        timeout: float = 10.0,
+    ) -> Optional[LogRecord]:
+        """
+        Wait for a structured (jsonl) log record matching a predicate.
 
-    def wait_for_pattern(self, pattern: str, timeout: float = 10.0):
-        """Wait for a regex pattern to appear in output. Returns Match object or None."""
-        import re
+        Already-captured records are checked first, so records emitted before the call are not missed.
 
-        deadline = time.time() + timeout
-        regex = re.compile(pattern)
+        Args:
+            predicate: Callable receiving the record dict; matched on keys rather than substrings
+            timeout: Maximum time to wait in seconds
 
-        # First check existing lines
-        with self.lock:
-            for line in self.lines:
-                match = regex.search(line)
-                if match:
-                    return match
+        Returns:
+            First matching record, or None on timeout
+        """
+        return self._wait_for_match(self.records, lambda record: record if predicate(record) else None, timeout)
 
-        # Wait for new lines
-        while time.time() < deadline:
-            try:
-                remaining = deadline - time.time()
-                if remaining <= 0:
-                    break
-                line = self.queue.get(timeout=min(remaining, 0.5))
-                match = regex.search(line)
-                if match:
-                    return match
-            except Empty:
-                continue
+    def wait_for_log(self, level: str, msg_contains: str, timeout: float = 10.0) -> Optional[LogRecord]:
+        """
+        Wait for a jsonl log record with the given level whose message contains a fragment.
 
-        return None
+        Args:
+            level: Log level name (DEBUG, INFO, WARN, ERROR)
+            msg_contains: Fragment expected in the record's ``msg`` field
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            Matching record, or None on timeout
+        """
+        return self.wait_for_record(
+            lambda record: record.get("level") == level and msg_contains in str(record.get("msg", "")),
+            timeout=timeout,
+        )
+
+    def wait_for_marker(self, marker: str, timeout: float = 10.0) -> bool:
+        """
+        Wait for a specific marker to appear in output.
+
+        Already-captured lines are scanned once; after that the waiter sleeps on its own event,
+        which the reader sets only when a new line contains the marker (no wakeup per line).
+        """
+        found = threading.Event()
+        waiter = (marker, found)
+        with self.lock:
+            if any(marker in line for line in self.lines):
+                return True
+            self._marker_waiters.append(waiter)
+        try:
+            return found.wait(timeout)
+        finally:
+            with self.lock:
+                self._marker_waiters.remove(waiter)
+
+    def wait_for_pattern(self, pattern: str, timeout: float = 10.0):
+        """Wait for a regex pattern to appear in output. Returns Match object or None."""
+        regex = re.compile(pattern)
+        return self._wait_for_match(self.lines, regex.search, timeout)
 
     def get_all_output(self) -> str:
         """Get all captured output as a single string."""
@@ -141,8 +374,12 @@ class OutputCapture:
             return "\n".join(recent)
 
     def stop(self):
-        """Stop the capture thread."""
+        """Stop capturing, giving the reader a short window to drain remaining output."""
         self.stop_event.set()
+        if self._fd is not None:
+            self._eof.wait(timeout=2.0)
+            _get_pipe_selector().unregister(self._fd)
+            self._fd = None
         if self._thread:
             self._thread.join(timeout=2.0)
 
@@ -184,6 +421,8 @@ class RuntimeFixture:
         self.process_info: Optional[ProcessInfo] = None
         self.capture: Optional[OutputCapture] = None
         self.config_path: Optional[Path] = None
+        # Owns config_path; removed by cleanup(), or by its finalizer if the fixture is just dropped
+        self._config_dir: Optional[tempfile.TemporaryDirectory] = None
 
     def start(
         self,
@@ -228,8 +467,9 @@ class RuntimeFixture:
                     [str(self.runtime_path), f"--config={self.config_path}"],
                     stdout=subprocess.PIPE,
                     stderr=subprocess.STDOUT,
-                    text=True,
-                    bufsize=1,
+                    # Raw unbuffered pipe: the shared selector reads the fd directly and
+                    # OutputCapture decodes incrementally, so no TextIOWrapper is needed.
+                    bufsize=0,
                     start_new_session=True,  # Creates new session, makes process session leader
                 )
                 pgid = os.getpgid(process.pid)  # Get process group ID
@@ -276,8 +516,8 @@ class RuntimeFixture:
         This is intentionally API-based (not log-marker-based), so tests do not depend
         on specific log text and are resilient to startup timing variance in CI.
         """
-        deadline = time.time() + max(timeout, 0.1)
-        while time.time() < deadline:
+        deadline = time.monotonic() + max(timeout, 0.1)
+        while time.monotonic() < deadline:
             if not self.is_running():
                 return False
 
@@ -318,17 +558,21 @@ class RuntimeFixture:
 
         return False
 
-    def cleanup(self):
+    def cleanup(self, grace_timeout: float = 5.0):
         """
         Clean up runtime process and resources.
 
         Uses process-group scoped termination:
         1. Send SIGTERM/CTRL_BREAK to entire process group
-        2. Wait up to 5 seconds for graceful shutdown
+        2. Wait up to grace_timeout seconds for graceful shutdown
         3. If still running, send SIGKILL/TERMINATE to group
         4. Clean up temp files and output capture
+
+        Args:
+            grace_timeout: Seconds to wait for graceful exit before force killing.
         """
         if not self.process_info:
+            self._remove_config()
             return
 
         try:
@@ -359,7 +603,7 @@ class RuntimeFixture:
 
             # Step 2: Wait for graceful shutdown
             try:
-                process.wait(timeout=5.0)
+                process.wait(timeout=grace_timeout)
                 if self.verbose:
                     print("[RuntimeFixture] Process exited gracefully")
             except subprocess.TimeoutExpired:
@@ -387,14 +631,26 @@ class RuntimeFixture:
         if self.capture:
             self.capture.stop()
 
-        if self.config_path and self.config_path.exists():
-            try:
-                self.config_path.unlink()
-            except OSError:
-                pass
+        self._remove_config()
 
         self.process_info = None
 
+    def _remove_config(self):
+        """Delete the temporary config directory, if one was created."""
+        if self._config_dir is not None:
+            self._config_dir.cleanup()
+            self._config_dir = None
+
+    def fast_cleanup(self):
+        """
+        Clean up with a short graceful-shutdown window.
+
+        For tests that only need the process gone (not a clean shutdown), this caps
+        teardown at ~0.5s before escalating to SIGKILL. The output capture keeps
+        draining the pipe meanwhile, so the child cannot block on a full pipe.
+        """
+        self.cleanup(grace_timeout=0.5)
+
     def get_pid(self) -> Optional[int]:
         """Get the runtime process PID, or None if not started."""
         return self.process_info.pid if self.process_info else None
@@ -420,57 +676,36 @@ class RuntimeFixture:
 
     def _create_config(self) -> bool:
         """Create temporary configuration file."""
-        if self.config_dict:
-            # Use custom config if provided
-            import yaml
-
-            try:
-                fd, path = tempfile.mkstemp(suffix=".yaml", prefix="anolis-test-")
-                with os.fdopen(fd, "w") as f:
-                    yaml.dump(self.config_dict, f)
-                self.config_path = Path(path)
-                return True
-            except Exception as e:
-                print(f"[RuntimeFixture] ERROR: Failed to create config: {e}")
-                return False
-
-        # Default config
-        # Get path to default provider config fixture
-        fixture_config = Path(__file__).parent.parent / "integration" / "fixtures" / "provider-sim-default.yaml"
-        fixture_config_str = str(fixture_config).replace("\\", "/")
-
-        config_content = f"""
-runtime: {{}}
-
-http:
-  enabled: true
-  bind: 127.0.0.1
-  port: {self.http_port}
-
-providers:
-  - id: sim0
-    command: {str(self.provider_path)}
-    args: ["--config", "{fixture_config_str}"]
-    timeout_ms: 5000
-
-polling:
-  interval_ms: 500
-
-telemetry:
-  enabled: false
-
-logging:
-  level: info
-"""
-
         try:
-            fd, path = tempfile.mkstemp(suffix=".yaml", prefix="anolis-test-")
-            os.write(fd, config_content.encode("utf-8"))
-            os.close(fd)
-            self.config_path = Path(path)
+            self._remove_config()
+            self._config_dir = tempfile.TemporaryDirectory(prefix="anolis-test-")
+            config_path = Path(self._config_dir.name) / "config.yaml"
+
+            if self.config_dict:
+                # Use custom config if provided
+                import yaml
+
+                # The runtime cannot be spawned until this file exists, so use libyaml's
+                # C emitter when PyYAML was built with it.
+                dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+                with open(config_path, "w", encoding="utf-8") as f:
+                    yaml.dump(self.config_dict, f, Dumper=dumper)
+            else:
+                # Default config
+                config_path.write_bytes(
+                    _DEFAULT_CONFIG_TEMPLATE
+                    % {
+                        b"port": self.http_port,
+                        b"command": os.fsencode(str(self.provider_path)),
+                        b"fixture_config": os.fsencode(_DEFAULT_PROVIDER_FIXTURE_CONFIG),
+                    }
+                )
+
+            self.config_path = config_path
             return True
         except Exception as e:
             print(f"[RuntimeFixture] ERROR: Failed to create config: {e}")
+            self._remove_config()
             return False
 
 
@@ -485,9 +720,9 @@ def verify_process_cleanup(pid: int, timeout: float = 2.0) -> bool:
     Returns:
         True if process terminated, False if still running
     """
-    deadline = time.time() + timeout
+    deadline = time.monotonic() + timeout
 
-    while time.time() < deadline:
+    while time.monotonic() < deadline:
         try:
             if sys.platform == "win32":
                 # Windows: Check exit code - if process is running, this raises
@@ -111,6 +111,30 @@ logging:
     EXPECT_NE(error.find("log level"), std::string::npos);
 }
 
+TEST_F(ConfigTest, InvalidLogFormat) {
+    std::string config_content = R"(
+runtime:
+
+http:
+  enabled: false
+
+providers:
+  - id: test
+    command: /path/to/provider
+
+logging:
+  level: info
+  format: xml
+)";
+
+    std::string config_path = create_config_file("invalid_log_format.yaml", config_content);
+    RuntimeConfig config;
+    std::string error;
+
+    EXPECT_FALSE(load_config(config_path, config, error));
+    EXPECT_NE(error.find("log format"), std::string::npos);
+}
+
 TEST_F(ConfigTest, NestedTelemetryStructure) {
     std::string config_content = R"(
 runtime:
@@ -413,6 +437,33 @@ logging:
     }
 }
 
+TEST_F(ConfigTest, ValidLogFormats) {
+    const std::vector<std::string> valid_formats = {"text", "jsonl"};
+
+    for (const auto& format : valid_formats) {
+        std::string config_content = R"(
+runtime:
+
+http:
+  enabled: false
+
+providers:
+  - id: test
+    command: /path/to/provider
+
+logging:
+  format: )" + format + R"(
+)";
+
+        std::string config_path = create_config_file("log_format_" + format + ".yaml", config_content);
+        RuntimeConfig config;
+        std::string error;
+
+        EXPECT_TRUE(load_config(config_path, config, error)) << "Format: " << format << ", Error: " << error;
+        EXPECT_EQ(config.logging.format, format);
+    }
+}
+
 TEST_F(ConfigTest, FileNotFound) {
     RuntimeConfig config;
     std::string error;
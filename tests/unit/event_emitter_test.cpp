@@ -385,6 +385,38 @@ TEST(EventEmitterTest, FilterBySignal) {
     EXPECT_FALSE(sub->try_pop().has_value());
 }
 
+TEST(EventEmitterTest, FilterByProviderAppliesToProviderHealthEvents) {
+    EventEmitter emitter;
+
+    EventFilter filter;
+    filter.provider_id = "provider1";
+
+    auto sub = emitter.subscribe(filter);
+
+    ProviderHealthChangeEvent matching;
+    matching.event_id = 0;
+    matching.provider_id = "provider1";
+    matching.state = "UNAVAILABLE";
+    matching.timestamp_ms = 1234567890;
+    matching.attempt_count = 1;
+    matching.crash_detected = true;
+
+    ProviderHealthChangeEvent other = matching;
+    other.provider_id = "provider2";
+
+    emitter.emit(other);
+    emitter.emit(matching);
+
+    auto evt = sub->pop(100);
+    ASSERT_TRUE(evt.has_value());
+    const auto &health = std::get<ProviderHealthChangeEvent>(*evt);
+    EXPECT_EQ(health.provider_id, "provider1");
+    EXPECT_EQ(health.attempt_count, 1);
+    EXPECT_TRUE(health.crash_detected);
+
+    EXPECT_FALSE(sub->try_pop().has_value());
+}
+
 TEST(EventEmitterTest, CombinedFilters) {
     EventEmitter emitter;
 
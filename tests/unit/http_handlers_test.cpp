@@ -844,6 +844,73 @@ TEST_F(HttpHandlersProvidersHealthTest, LifecycleStateCircuitOpenWhenAttemptsExc
     EXPECT_TRUE(sup["next_restart_in_ms"].is_null());
 }
 
+TEST_F(HttpHandlersProvidersHealthTest, ETagRevalidatesUntilSupervisionChanges) {
+    EXPECT_CALL(*mock_provider, list_devices(_)).WillOnce(Invoke([](std::vector<Device>& devices) {
+        Device dev;
+        dev.set_device_id("dev1");
+        devices.push_back(dev);
+        return true;
+    }));
+    EXPECT_CALL(*mock_provider, describe_device("dev1", _))
+        .WillOnce(Invoke([](const std::string&, DescribeDeviceResponse& response) {
+            response.mutable_device()->set_device_id("dev1");
+            auto* sig = response.mutable_capabilities()->add_signals();
+            sig->set_signal_id("temp");
+            sig->set_value_type(anolis::deviceprovider::v1::VALUE_TYPE_DOUBLE);
+            sig->set_poll_hint_hz(1.0);  // Default signal, so the state cache tracks the device
+            return true;
+        }));
+    ASSERT_TRUE(registry->discover_provider("test_provider", *mock_provider));
+
+    auto first = client->Get("/v0/providers/health");
+    ASSERT_TRUE(first);
+    ASSERT_EQ(200, first->status);
+    ASSERT_TRUE(first->has_header("ETag"));
+    const std::string etag = first->get_header_value("ETag");
+    EXPECT_EQ(0u, etag.rfind("W/", 0));
+    EXPECT_EQ("no-store", first->get_header_value("Cache-Control"));
+    // Registered but not yet tracked by the state cache.
+    EXPECT_EQ("UNKNOWN", nlohmann::json::parse(first->body)["providers"][0]["devices"][0]["health"]);
+
+    // Unchanged supervision state: 304 with no body.
+    auto unchanged = client->Get("/v0/providers/health", httplib::Headers{{"If-None-Match", etag}});
+    ASSERT_TRUE(unchanged);
+    EXPECT_EQ(304, unchanged->status);
+    EXPECT_TRUE(unchanged->body.empty());
+
+    // If-None-Match lists, the strong form of the tag, and "*" all match weakly.
+    for (const std::string& header : {"W/\"stale\", " + etag, etag.substr(2), std::string("*")}) {
+        auto listed = client->Get("/v0/providers/health", httplib::Headers{{"If-None-Match", header}});
+        ASSERT_TRUE(listed);
+        EXPECT_EQ(304, listed->status) << header;
+    }
+    auto other = client->Get("/v0/providers/health", httplib::Headers{{"If-None-Match", "W/\"stale\""}});
+    ASSERT_TRUE(other);
+    EXPECT_EQ(200, other->status);
+
+    // Only the device's staleness category moves (UNKNOWN -> OK); availability, device count and
+    // supervision are unchanged, but the validator must still change.
+    ASSERT_TRUE(state_cache->initialize());
+
+    auto polled = client->Get("/v0/providers/health", httplib::Headers{{"If-None-Match", etag}});
+    ASSERT_TRUE(polled);
+    EXPECT_EQ(200, polled->status);
+    const std::string polled_etag = polled->get_header_value("ETag");
+    EXPECT_NE(etag, polled_etag);
+    EXPECT_EQ("OK", nlohmann::json::parse(polled->body)["providers"][0]["devices"][0]["health"]);
+
+    // A crash transition changes the validator and returns a full body again.
+    ASSERT_TRUE(supervisor->mark_crash_detected("test_provider"));
+    EXPECT_CALL(*mock_provider, is_available()).WillRepeatedly(Return(false));
+
+    auto changed = client->Get("/v0/providers/health", httplib::Headers{{"If-None-Match", polled_etag}});
+    ASSERT_TRUE(changed);
+    EXPECT_EQ(200, changed->status);
+    EXPECT_NE(polled_etag, changed->get_header_value("ETag"));
+    auto json = nlohmann::json::parse(changed->body);
+    EXPECT_EQ("UNAVAILABLE", json["providers"][0]["state"]);
+}
+
 TEST_F(HttpHandlersProvidersHealthTest, LastSeenAgoMsIsPresentAndCorrectType) {
     auto res = client->Get("/v0/providers/health");
     ASSERT_TRUE(res);